@@ -4,21 +4,20 @@ Test script for the Advanced Level features of the Todo Application.
 This script tests all the new functionality added in the Advanced Phase.
 """
 
+import sys
 from todo_app import TaskManager, CLIInterface
 from datetime import datetime, timedelta
 
-def test_advanced_features():
+def test_advanced_features(task_manager, cli):
     """Test all the new Advanced Level features."""
     print("Testing Advanced Level Features...")
 
-    # Initialize the task manager
-    task_manager = TaskManager()
-    cli = CLIInterface(task_manager)
+    now = datetime.now()
 
     print("\n1. Testing Task Creation with Due Dates and Recurrence...")
 
     # Test adding tasks with due date and recurrence
-    due_date = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d %H:%M")
+    due_date = (now + timedelta(days=1)).isoformat(timespec="minutes")
     task1 = task_manager.add_task(
         "Complete project documentation",
         "high",
@@ -30,7 +29,7 @@ def test_advanced_features():
     print(f"   Due date: {task1.due_date}")
     print(f"   Recurrence: {task1.recurrence}")
 
-    due_date2 = (datetime.now() - timedelta(hours=1)).strftime("%Y-%m-%d %H:%M")  # Past due
+    due_date2 = (now - timedelta(hours=1)).isoformat(timespec="minutes")  # Past due
     task2 = task_manager.add_task(
         "Buy groceries",
         "medium",
@@ -45,7 +44,7 @@ def test_advanced_features():
     print("\n2. Testing Task Update with Due Dates and Recurrence...")
 
     # Test updating task with new due date and recurrence
-    new_due_date = (datetime.now() + timedelta(days=3)).strftime("%Y-%m-%d %H:%M")
+    new_due_date = (now + timedelta(days=3)).isoformat(timespec="minutes")
     task_manager.update_task(
         task1.id,
         new_due_date=new_due_date,
@@ -59,23 +58,29 @@ def test_advanced_features():
     print("\n3. Testing Due Date Status Classification...")
 
     # Test due date status classification
-    status1, indicator1 = cli.get_due_date_status(task1.due_date)
+    status1, indicator1 = cli.get_due_date_status(task1.due_date, now)
     print(f"   Task 1 status: {status1} ({indicator1})")
 
-    status2, indicator2 = cli.get_due_date_status(task2.due_date)
+    status2, indicator2 = cli.get_due_date_status(task2.due_date, now)
     print(f"   Task 2 status: {status2} ({indicator2})")
 
     print("\n4. Testing Recurrence Logic...")
 
     # Test completing a recurring task
-    print(f"   Before completing task 2: {len(task_manager.get_all_tasks())} tasks")
+    count_before = task_manager.count_tasks()
+    print(f"   Before completing task 2: {count_before} tasks")
     task_manager.mark_complete(task2.id)
-    print(f"   After completing task 2: {len(task_manager.get_all_tasks())} tasks")
 
     # Should now have 3 tasks: original completed task 2 + new recurring instance
     all_tasks = task_manager.get_all_tasks()
-    completed_task = next((t for t in all_tasks if t.id == task2.id and t.completed), None)
-    new_recurring_task = next((t for t in all_tasks if t.id != task2.id and t.description == task2.description), None)
+    print(f"   After completing task 2: {len(all_tasks)} tasks")
+    task2_id = task2.id
+    task2_description = task2.description
+    by_id = {t.id: t for t in all_tasks}
+    original_task = by_id.get(task2_id)
+    completed_task = original_task if original_task and original_task.completed else None
+    by_desc = {t.description: t for t in all_tasks if t.id != task2_id}
+    new_recurring_task = by_desc.get(task2_description)
 
     print(f"   Original task completed: {completed_task is not None}")
     print(f"   New recurring task created: {new_recurring_task is not None}")
@@ -85,34 +90,36 @@ def test_advanced_features():
     print("\n5. Testing Filter Functionality with New Fields...")
 
     # Test filtering by due status
-    overdue_tasks = task_manager.filter_tasks(due_status="overdue")
-    print(f"   Overdue tasks: {len(overdue_tasks)}")
+    overdue_count = task_manager.count_tasks(due_status="overdue")
+    print(f"   Overdue tasks: {overdue_count}")
 
-    upcoming_tasks = task_manager.filter_tasks(due_status="upcoming")
-    print(f"   Upcoming tasks: {len(upcoming_tasks)}")
+    upcoming_count = task_manager.count_tasks(due_status="upcoming")
+    print(f"   Upcoming tasks: {upcoming_count}")
 
     # Test filtering by recurrence
-    daily_tasks = task_manager.filter_tasks(recurrence="daily")
-    print(f"   Daily recurring tasks: {len(daily_tasks)}")
+    daily_count = task_manager.count_tasks(recurrence="daily")
+    print(f"   Daily recurring tasks: {daily_count}")
 
-    weekly_tasks = task_manager.filter_tasks(recurrence="weekly")
-    print(f"   Weekly recurring tasks: {len(weekly_tasks)}")
+    weekly_count = task_manager.count_tasks(recurrence="weekly")
+    print(f"   Weekly recurring tasks: {weekly_count}")
 
     print("\n6. Testing Sort Functionality with New Fields...")
 
     # Test sorting by due date
     sorted_by_due = task_manager.sort_tasks("due_date", reverse=False)  # Earliest first
     print("   Tasks sorted by due date (earliest first):")
-    for task in sorted_by_due[:3]:  # Show first 3
-        due_status, indicator = cli.get_due_date_status(task.due_date)
-        print(f"     - {task.description} [{task.due_date} {indicator}]")
+    shown = sorted_by_due[:3]  # Show first 3
+    statuses = cli.get_due_date_statuses([task.due_date for task in shown], now)
+    sys.stdout.write("".join(f"     - {task.description} [{task.due_date} {indicator}]\n"
+                             for task, (due_status, indicator) in zip(shown, statuses)))
 
     # Test sorting by due status
     sorted_by_status = task_manager.sort_tasks("due_status", reverse=True)  # Overdue first
     print("\n   Tasks sorted by due status (overdue first):")
-    for task in sorted_by_status[:3]:  # Show first 3
-        due_status, indicator = cli.get_due_date_status(task.due_date)
-        print(f"     - {task.description} [{due_status}]")
+    shown = sorted_by_status[:3]  # Show first 3
+    statuses = cli.get_due_date_statuses([task.due_date for task in shown], now)
+    sys.stdout.write("".join(f"     - {task.description} [{due_status}]\n"
+                             for task, (due_status, indicator) in zip(shown, statuses)))
 
     print("\n7. Testing Validation...")
 
@@ -127,4 +134,5 @@ def test_advanced_features():
     print("\nAll Advanced Level features tested successfully!")
 
 if __name__ == "__main__":
-    test_advanced_features()
\ No newline at end of file
+    task_manager = TaskManager()
+    test_advanced_features(task_manager, CLIInterface(task_manager))
\ No newline at end of file
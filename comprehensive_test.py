@@ -4,28 +4,44 @@ Comprehensive test for the enhanced Todo Application CLI.
 This script simulates user interactions to verify all features work together.
 """
 
-from todo_app import TaskManager, CLIInterface
 import io
 import sys
-from contextlib import redirect_stdout, redirect_stderr
+from contextlib import redirect_stdout
+from pathlib import Path
 
-def test_cli_integration():
-    """Test the CLI integration of all features."""
-    print("Testing CLI Integration of All Features...")
+import pytest
+from todo_app import TaskManager, CLIInterface
 
-    # Initialize the task manager and CLI
-    task_manager = TaskManager()
-    cli = CLIInterface(task_manager)
+GOLDEN_OUTPUT = Path(__file__).with_name("golden") / "cli_integration.txt"
+
+# Canned inputs for the edge-case probes
+_MANY_TAGS = tuple(f"tag{i}" for i in range(11))  # 11 tags, max is 10
+_INVALID_PRIORITY = "invalid_priority"
+_EMPTY_DESCRIPTION = ""
+_TEST_DESCRIPTION = "Test task"
+
+def test_cli_integration(task_manager, cli):
+    """Test the CLI integration of all features against the golden output."""
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        _run_cli_integration(task_manager, cli)
+    assert buf.getvalue() == GOLDEN_OUTPUT.read_text()
+
+def _run_cli_integration(task_manager, cli):
+    """Exercise search, filter, sort, update, and display features together."""
+    print("Testing CLI Integration of All Features...")
 
     # Add some test tasks
     print("\nAdding test tasks...")
-    task1 = task_manager.add_task("Complete project proposal", "high", ["work", "important", "deadline"])
-    task2 = task_manager.add_task("Buy groceries for weekend", "medium", ["personal", "shopping"])
-    task3 = task_manager.add_task("Schedule team meeting", "low", ["work", "meeting"])
-    task4 = task_manager.add_task("Review code changes", "high", ["work", "development"])
-    task5 = task_manager.add_task("Plan vacation", "medium", ["personal", "travel"])
+    task1, task2, task3, task4, task5 = task_manager.add_tasks([
+        ("Complete project proposal", "high", ["work", "important", "deadline"]),
+        ("Buy groceries for weekend", "medium", ["personal", "shopping"]),
+        ("Schedule team meeting", "low", ["work", "meeting"]),
+        ("Review code changes", "high", ["work", "development"]),
+        ("Plan vacation", "medium", ["personal", "travel"]),
+    ])
 
-    print(f"Added {len(task_manager.get_all_tasks())} tasks")
+    print(f"Added {task_manager.count_tasks()} tasks")
 
     # Test search functionality
     print("\nTesting search functionality...")
@@ -37,35 +53,25 @@ def test_cli_integration():
 
     # Test filtering functionality
     print("\nTesting filtering functionality...")
-    high_priority_tasks = task_manager.filter_tasks(priority="high")
-    print(f"High priority tasks: {len(high_priority_tasks)}")
-
-    work_tasks = task_manager.filter_tasks(tags=["work"])
-    print(f"Work tasks: {len(work_tasks)}")
-
-    active_tasks = task_manager.filter_tasks(status="active")
-    print(f"Active tasks: {len(active_tasks)}")
+    print(f"High priority tasks: {task_manager.count_tasks(priority='high')}")
+    print(f"Work tasks: {task_manager.count_tasks(tags=['work'])}")
+    print(f"Active tasks: {task_manager.count_tasks(status='active')}")
 
     # Mark a task as complete to test status filtering
     task_manager.mark_complete(task1.id)
-    completed_tasks = task_manager.filter_tasks(status="completed")
-    print(f"Completed tasks after marking one complete: {len(completed_tasks)}")
-
-    active_tasks = task_manager.filter_tasks(status="active")
-    print(f"Active tasks after marking one complete: {len(active_tasks)}")
+    print(f"Completed tasks after marking one complete: {task_manager.count_tasks(status='completed')}")
+    print(f"Active tasks after marking one complete: {task_manager.count_tasks(status='active')}")
 
     # Test sorting functionality
     print("\nTesting sorting functionality...")
     sorted_by_priority = task_manager.sort_tasks("priority", reverse=True)
     print("Tasks sorted by priority (high to low):")
-    for task in sorted_by_priority[:3]:  # Show first 3
-        priority_indicator = cli.get_priority_indicator(task.priority)
-        print(f"  - {task.description} [{priority_indicator}]")
+    sys.stdout.write("".join(f"  - {task.description} [{cli.get_priority_indicator(task.priority)}]\n"
+                             for task in sorted_by_priority[:3]))  # Show first 3
 
     sorted_by_title = task_manager.sort_tasks("title", reverse=False)
     print("\nTasks sorted by title (A-Z):")
-    for task in sorted_by_title[:3]:  # Show first 3
-        print(f"  - {task.description}")
+    sys.stdout.write("".join(f"  - {task.description}\n" for task in sorted_by_title[:3]))  # Show first 3
 
     # Test updating a task
     print("\nTesting task update functionality...")
@@ -90,52 +96,41 @@ def test_cli_integration():
 
     print("\nCLI Integration test completed successfully!")
 
-def test_edge_cases():
-    """Test edge cases and error handling."""
-    print("\nTesting Edge Cases...")
+# Keyword arguments that add_task must reject, keyed by the rule they break
+_REJECTED_ADD_CASES = [
+    pytest.param({"description": _EMPTY_DESCRIPTION}, id="empty-description"),
+    pytest.param({"tags": list(_MANY_TAGS)}, id="more-than-10-tags"),
+    pytest.param({"priority": _INVALID_PRIORITY}, id="invalid-priority"),
+    pytest.param({"tags": ["", "valid_tag"]}, id="empty-tag"),
+]
+
+@pytest.mark.parametrize("kwargs", _REJECTED_ADD_CASES)
+def test_add_task_rejects(task_manager, kwargs):
+    """Test add_task raises ValueError for each invalid input."""
+    with pytest.raises(ValueError):
+        task_manager.add_task(**{"description": _TEST_DESCRIPTION, **kwargs})
+
+def test_update_task_rejects_invalid_priority(task_manager):
+    """Test update_task raises ValueError for an invalid priority."""
+    task = task_manager.add_task("Test task for update")
+    with pytest.raises(ValueError):
+        task_manager.update_task(task.id, new_priority=_INVALID_PRIORITY)
 
+if __name__ == "__main__":
+    import platform
+    if platform.python_implementation() == "PyPy":
+        # Warm up the JIT on the search/filter/sort loops before the reported run
+        with redirect_stdout(io.StringIO()):
+            warmup_manager = TaskManager()
+            _run_cli_integration(warmup_manager, CLIInterface(warmup_manager))
     task_manager = TaskManager()
+    _run_cli_integration(task_manager, CLIInterface(task_manager))
 
-    # Test adding task with empty description
-    try:
-        task_manager.add_task("")
-        print("  ERROR: Should not allow empty task description")
-    except ValueError:
-        print("  OK: Correctly rejects empty task description")
-
-    # Test adding task with too many tags
-    try:
-        many_tags = [f"tag{i}" for i in range(11)]  # 11 tags, max is 10
-        task_manager.add_task("Test task", tags=many_tags)
-        print("  ERROR: Should not allow more than 10 tags")
-    except ValueError:
-        print("  OK: Correctly rejects more than 10 tags")
-
-    # Test adding task with invalid priority
-    try:
-        task_manager.add_task("Test task", priority="invalid_priority")
-        print("  ERROR: Should not allow invalid priority")
-    except ValueError:
-        print("  OK: Correctly rejects invalid priority")
-
-    # Test updating with invalid priority
-    task = task_manager.add_task("Test task for update")
-    try:
-        task_manager.update_task(task.id, new_priority="invalid_priority")
-        print("  ERROR: Should not allow invalid priority in update")
-    except ValueError:
-        print("  OK: Correctly rejects invalid priority in update")
-
-    # Test tag with empty string
-    try:
-        task_manager.add_task("Test task", tags=["", "valid_tag"])
-        print("  ERROR: Should not allow empty tag")
-    except ValueError:
-        print("  OK: Correctly rejects empty tag")
-
+    print("\nTesting Edge Cases...")
+    for case in _REJECTED_ADD_CASES:
+        test_add_task_rejects(TaskManager(), *case.values)
+        print(f"  OK: Correctly rejects {case.id}")
+    test_update_task_rejects_invalid_priority(TaskManager())
+    print("  OK: Correctly rejects invalid priority in update")
     print("Edge case testing completed!")
-
-if __name__ == "__main__":
-    test_cli_integration()
-    test_edge_cases()
     print("\nAll tests passed! The Intermediate Phase implementation is working correctly.")
\ No newline at end of file
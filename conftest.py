@@ -0,0 +1,14 @@
+import pytest
+from todo_app import TaskManager, CLIInterface
+
+
+@pytest.fixture
+def task_manager():
+    """Provide a fresh, empty TaskManager."""
+    return TaskManager()
+
+
+@pytest.fixture
+def cli(task_manager):
+    """Provide a CLIInterface bound to the task_manager fixture."""
+    return CLIInterface(task_manager)
@@ -4,15 +4,26 @@ Test script for the enhanced Todo Application.
 This script tests all the new functionality added in the Intermediate Phase.
 """
 
+import io
+import sys
+from contextlib import redirect_stdout
+from pathlib import Path
 from todo_app import TaskManager, CLIInterface
 
-def test_intermediate_features():
-    """Test all the new Intermediate Phase features."""
-    print("Testing Intermediate Phase Features...")
+GOLDEN_OUTPUT = Path(__file__).with_name("golden") / "intermediate_features.txt"
 
-    # Initialize the task manager
-    task_manager = TaskManager()
-    cli = CLIInterface(task_manager)
+def test_intermediate_features(task_manager, cli):
+    """Test all the new Intermediate Phase features against the golden output."""
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        _run_intermediate_features(task_manager, cli)
+    output = buf.getvalue()
+    sys.stdout.write(output)
+    assert output == GOLDEN_OUTPUT.read_text()
+
+def _run_intermediate_features(task_manager, cli):
+    """Exercise priority, tag, search, filter, and sort features."""
+    print("Testing Intermediate Phase Features...")
 
     print("\n1. Testing Task Creation with Priority and Tags...")
 
@@ -49,32 +60,30 @@ def test_intermediate_features():
     print("\n4. Testing Filter Functionality...")
 
     # Test filtering by priority
-    high_priority_tasks = task_manager.filter_tasks(priority="high")
-    print(f"   High priority tasks: {len(high_priority_tasks)} tasks found")
+    high_priority_count = task_manager.count_tasks(priority="high")
+    print(f"   High priority tasks: {high_priority_count} tasks found")
 
-    medium_priority_tasks = task_manager.filter_tasks(priority="medium")
-    print(f"   Medium priority tasks: {len(medium_priority_tasks)} tasks found")
+    medium_priority_count = task_manager.count_tasks(priority="medium")
+    print(f"   Medium priority tasks: {medium_priority_count} tasks found")
 
-    work_tasks = task_manager.filter_tasks(tags=["work"])
-    print(f"   Tasks with 'work' tag: {len(work_tasks)} tasks found")
+    work_count = task_manager.count_tasks(tags=["work"])
+    print(f"   Tasks with 'work' tag: {work_count} tasks found")
 
-    personal_tasks = task_manager.filter_tasks(tags=["personal"])
-    print(f"   Tasks with 'personal' tag: {len(personal_tasks)} tasks found")
+    personal_count = task_manager.count_tasks(tags=["personal"])
+    print(f"   Tasks with 'personal' tag: {personal_count} tasks found")
 
     print("\n5. Testing Sort Functionality...")
 
     # Test sorting by priority
     sorted_by_priority = task_manager.sort_tasks("priority", reverse=True)  # High to low
     print("   Tasks sorted by priority (High to Low):")
-    for task in sorted_by_priority:
-        priority_indicator = cli.get_priority_indicator(task.priority)
-        print(f"     - {task.description} [{priority_indicator}]")
+    sys.stdout.write("".join(f"     - {task.description} [{cli.get_priority_indicator(task.priority)}]\n"
+                             for task in sorted_by_priority))
 
     # Test sorting by title
     sorted_by_title = task_manager.sort_tasks("title", reverse=False)  # A-Z
     print("   Tasks sorted by title (A-Z):")
-    for task in sorted_by_title:
-        print(f"     - {task.description}")
+    sys.stdout.write("".join(f"     - {task.description}\n" for task in sorted_by_title))
 
     print("\n6. Testing Combined Operations...")
 
@@ -96,4 +105,5 @@ def test_intermediate_features():
     print("\nAll Intermediate Phase features tested successfully!")
 
 if __name__ == "__main__":
-    test_intermediate_features()
\ No newline at end of file
+    task_manager = TaskManager()
+    test_intermediate_features(task_manager, CLIInterface(task_manager))
\ No newline at end of file
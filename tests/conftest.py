@@ -0,0 +1,27 @@
+import copy
+import io
+
+import pytest
+from todo_app import TaskManager
+
+
+@pytest.fixture(scope="module")
+def _template_manager():
+    """Build the prepopulated TaskManager once per module."""
+    task_manager = TaskManager()
+    task_manager.add_tasks([("Task 1",), ("Task 2",)])
+    return task_manager
+
+
+@pytest.fixture
+def populated_manager(_template_manager):
+    """Provide an independent copy of the prepopulated TaskManager."""
+    return copy.deepcopy(_template_manager)
+
+
+@pytest.fixture
+def feed_stdin(monkeypatch):
+    """Return a helper that queues input lines for the built-in input() to read."""
+    def _feed(lines):
+        monkeypatch.setattr("sys.stdin", io.StringIO("".join(f"{line}\n" for line in lines)))
+    return _feed
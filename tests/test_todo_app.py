@@ -1,496 +1,737 @@
+from datetime import datetime, timedelta
+
 import pytest
-from todo_app import Task, TaskManager, CLIInterface
+from todo_app import Task, CLIInterface
 
 
-class TestTask:
-    """Test the Task data model."""
+# Task data model
+def test_task_creation():
+    """Test creating a Task with valid attributes."""
+    task = Task(id=1, description="Test task", completed=False)
+    assert task.id == 1
+    assert task.description == "Test task"
+    assert task.completed is False
 
-    def test_task_creation(self):
-        """Test creating a Task with valid attributes."""
-        task = Task(id=1, description="Test task", completed=False)
-        assert task.id == 1
-        assert task.description == "Test task"
-        assert task.completed is False
 
-    def test_task_defaults(self):
-        """Test Task creation with default values."""
-        task = Task(id=1, description="Test task")
-        assert task.id == 1
-        assert task.description == "Test task"
-        assert task.completed is False  # Default value
+def test_task_defaults():
+    """Test Task creation with default values."""
+    task = Task(id=1, description="Test task")
+    assert task.id == 1
+    assert task.description == "Test task"
+    assert task.completed is False  # Default value
 
 
-class TestTaskManager:
-    """Test the TaskManager functionality."""
+def test_task_uses_slots():
+    """Test Task instances store attributes in slots rather than a __dict__."""
+    task = Task(id=1, description="Test task")
+    assert not hasattr(task, "__dict__")
 
-    def setup_method(self):
-        """Set up a fresh TaskManager for each test."""
-        self.task_manager = TaskManager()
 
-    def test_add_task(self):
-        """Test adding a task to the manager."""
-        task = self.task_manager.add_task("Test task")
-        assert task.id == 1
-        assert task.description == "Test task"
-        assert task.completed is False
+def test_task_equality_is_identity():
+    """Test Tasks compare by identity, so distinct tasks with equal fields differ."""
+    task = Task(id=1, description="Test task", created_at="2026-01-01T09:00:00")
+    twin = Task(id=1, description="Test task", created_at="2026-01-01T09:00:00")
+    assert task == task
+    assert task != twin
 
-    def test_add_task_empty_description(self):
-        """Test adding a task with empty description raises ValueError."""
-        with pytest.raises(ValueError):
-            self.task_manager.add_task("")
 
-    def test_add_task_whitespace_description(self):
-        """Test adding a task with whitespace-only description raises ValueError."""
-        with pytest.raises(ValueError):
-            self.task_manager.add_task("   ")
-
-    def test_get_all_tasks_empty(self):
-        """Test getting all tasks when the list is empty."""
-        tasks = self.task_manager.get_all_tasks()
-        assert tasks == []
-
-    def test_get_all_tasks_with_tasks(self):
-        """Test getting all tasks when the list has tasks."""
-        self.task_manager.add_task("Task 1")
-        self.task_manager.add_task("Task 2")
-        tasks = self.task_manager.get_all_tasks()
-        assert len(tasks) == 2
-        assert tasks[0].description == "Task 1"
-        assert tasks[1].description == "Task 2"
-
-    def test_get_task_by_id_found(self):
-        """Test getting a task by ID that exists."""
-        task = self.task_manager.add_task("Test task")
-        found_task = self.task_manager.get_task_by_id(task.id)
-        assert found_task is not None
-        assert found_task.id == task.id
-        assert found_task.description == task.description
-
-    def test_get_task_by_id_not_found(self):
-        """Test getting a task by ID that doesn't exist."""
-        result = self.task_manager.get_task_by_id(999)
-        assert result is None
-
-    def test_update_task(self):
-        """Test updating a task's description."""
-        task = self.task_manager.add_task("Original task")
-        updated = self.task_manager.update_task(task.id, "Updated task")
-        assert updated is True
-
-        updated_task = self.task_manager.get_task_by_id(task.id)
-        assert updated_task.description == "Updated task"
-
-    def test_update_task_empty_description(self):
-        """Test updating a task with empty description raises ValueError."""
-        task = self.task_manager.add_task("Original task")
-        with pytest.raises(ValueError):
-            self.task_manager.update_task(task.id, "")
+# TaskManager
+def test_add_task(task_manager):
+    """Test adding a task to the manager."""
+    task = task_manager.add_task("Test task")
+    assert task.id == 1
+    assert task.description == "Test task"
+    assert task.completed is False
+
+
+def test_add_task_empty_description(task_manager):
+    """Test adding a task with empty description raises ValueError."""
+    with pytest.raises(ValueError):
+        task_manager.add_task("")
+
+
+def test_add_task_whitespace_description(task_manager):
+    """Test adding a task with whitespace-only description raises ValueError."""
+    with pytest.raises(ValueError):
+        task_manager.add_task("   ")
+
+
+def test_add_task_invalid_due_date(task_manager):
+    """Test adding a task with a malformed due date raises ValueError."""
+    with pytest.raises(ValueError):
+        task_manager.add_task("Test task", due_date="not a date")
+
+
+def test_add_task_normalizes_utc_due_date(task_manager):
+    """Test a trailing "Z" on a due date is stored as an explicit +00:00 offset."""
+    task = task_manager.add_task("Test task", due_date="2030-01-01T09:00:00Z")
+    assert task.due_date == "2030-01-01T09:00:00+00:00"
+
+
+def test_add_tasks(task_manager):
+    """Test adding several tasks in one call."""
+    tasks = task_manager.add_tasks([("Task 1",), ("Task 2", "high", ["work"])])
+    assert [task.id for task in tasks] == [1, 2]
+    assert tasks[1].priority == "high"
+    assert tasks[1].tags == ["work"]
+    assert task_manager.filter_tasks(tags=["work"]) == [tasks[1]]
+
+
+def test_add_tasks_invalid_spec_adds_nothing(task_manager):
+    """Test that one invalid spec prevents the whole batch from being added."""
+    with pytest.raises(ValueError):
+        task_manager.add_tasks([("Task 1",), ("",)])
+    assert task_manager.get_all_tasks() == ()
+
+
+def test_get_all_tasks_empty(task_manager):
+    """Test getting all tasks when the list is empty."""
+    tasks = task_manager.get_all_tasks()
+    assert tasks == ()
+
+
+def test_get_all_tasks_with_tasks(task_manager):
+    """Test getting all tasks when the list has tasks."""
+    task_manager.add_task("Task 1")
+    task_manager.add_task("Task 2")
+    tasks = task_manager.get_all_tasks()
+    assert len(tasks) == 2
+    assert tasks[0].description == "Task 1"
+    assert tasks[1].description == "Task 2"
+
+
+def test_get_all_tasks_tracks_adds_and_deletes(task_manager):
+    """Test get_all_tasks reflects tasks added or removed since the previous call."""
+    first = task_manager.add_task("Task 1")
+    assert task_manager.get_all_tasks() == (first,)
+
+    second = task_manager.add_task("Task 2", due_date="2026-01-01T09:00:00", recurrence="daily")
+    assert task_manager.get_all_tasks() == (first, second)
+
+    task_manager.delete_task(first.id)
+    task_manager.mark_complete(second.id)  # Creates the next occurrence
+    tasks = task_manager.get_all_tasks()
+    assert [task.id for task in tasks] == [second.id, second.id + 1]
+
+
+def test_get_task_by_id_found(task_manager):
+    """Test getting a task by ID that exists."""
+    task = task_manager.add_task("Test task")
+    found_task = task_manager.get_task_by_id(task.id)
+    assert found_task is not None
+    assert found_task.id == task.id
+    assert found_task.description == task.description
+
+
+def test_get_task_by_id_not_found(task_manager):
+    """Test getting a task by ID that doesn't exist."""
+    result = task_manager.get_task_by_id(999)
+    assert result is None
+
+
+def test_update_task(task_manager):
+    """Test updating a task's description."""
+    task = task_manager.add_task("Original task")
+    updated = task_manager.update_task(task.id, "Updated task")
+    assert updated is True
+
+    updated_task = task_manager.get_task_by_id(task.id)
+    assert updated_task.description == "Updated task"
+
+
+def test_update_task_empty_description(task_manager):
+    """Test updating a task with empty description raises ValueError."""
+    task = task_manager.add_task("Original task")
+    with pytest.raises(ValueError):
+        task_manager.update_task(task.id, "")
+
+
+def test_update_task_whitespace_description(task_manager):
+    """Test updating a task with whitespace-only description raises ValueError."""
+    task = task_manager.add_task("Original task")
+    with pytest.raises(ValueError):
+        task_manager.update_task(task.id, "   ")
+
+
+def test_update_task_not_found(task_manager):
+    """Test updating a task that doesn't exist."""
+    result = task_manager.update_task(999, "New description")
+    assert result is False
+
+
+def test_delete_task(task_manager):
+    """Test deleting an existing task."""
+    task = task_manager.add_task("Test task")
+    deleted = task_manager.delete_task(task.id)
+    assert deleted is True
+    assert task_manager.get_task_by_id(task.id) is None
+
+
+def test_delete_task_not_found(task_manager):
+    """Test deleting a task that doesn't exist."""
+    result = task_manager.delete_task(999)
+    assert result is False
+
+
+def test_search_tasks_after_update(task_manager):
+    """Test searching matches a task's updated description, case-insensitively."""
+    task = task_manager.add_task("Original task")
+    task_manager.update_task(task.id, "Buy Groceries")
+    assert task_manager.search_tasks("original") == []
+    assert task_manager.search_tasks("GROCERIES") == [task]
+
+
+def test_search_tasks_casefolds(task_manager):
+    """Test searching matches case variants that lower() alone would miss."""
+    task = task_manager.add_task("Walk to Hauptstraße")
+    assert task_manager.search_tasks("HAUPTSTRASSE") == [task]
+
+
+def test_filter_tasks_by_tags(task_manager):
+    """Test tag filtering follows tag updates and deletions."""
+    work = task_manager.add_task("Write report", tags=["work"])
+    home = task_manager.add_task("Clean kitchen", tags=["home"])
+    both = task_manager.add_task("Plan week", tags=["work", "home"])
+    assert task_manager.filter_tasks(tags=["work"]) == [work, both]
+
+    task_manager.update_task(work.id, new_tags=["home"])
+    task_manager.delete_task(both.id)
+    assert task_manager.filter_tasks(tags=["work"]) == []
+    assert task_manager.filter_tasks(tags=["home", "work"]) == [work, home]
+
+
+def test_filter_tasks_by_priority_and_status_after_changes(task_manager):
+    """Test priority and status filtering follow updates, completions, and deletions."""
+    report = task_manager.add_task("Write report", priority="high")
+    kitchen = task_manager.add_task("Clean kitchen", priority="low")
+    week = task_manager.add_task("Plan week", priority="high")
+
+    task_manager.update_task(kitchen.id, new_priority="high")
+    task_manager.mark_complete(report.id)
+    task_manager.delete_task(week.id)
+    assert task_manager.filter_tasks(priority="high") == [report, kitchen]
+    assert task_manager.filter_tasks(status="active", priority="high") == [kitchen]
+
+    task_manager.mark_incomplete(report.id)
+    assert task_manager.filter_tasks(status="completed") == []
+    assert task_manager.count_tasks(status="active", priority="high") == 2
+
+
+def test_filter_tasks_by_due_status_after_update(task_manager):
+    """Test due status filtering follows due date updates."""
+    task = task_manager.add_task("Renew passport", due_date="2999-01-01T09:00:00")
+    assert task_manager.filter_tasks(due_status="overdue") == []
+
+    task_manager.update_task(task.id, new_due_date="2000-01-01T09:00:00")
+    assert task_manager.filter_tasks(due_status="overdue") == [task]
+
+
+def test_filter_tasks_due_soon_excludes_later_days(task_manager):
+    """Test a task due days from now is upcoming, not due soon, whatever its time of day."""
+    due = (datetime.now() + timedelta(days=2, minutes=30)).isoformat()
+    task = task_manager.add_task("Dentist", due_date=due)
+    assert task_manager.filter_tasks(due_status="due-soon") == []
+    assert task_manager.filter_tasks(due_status="upcoming") == [task]
+
+
+def test_count_tasks_matches_filter_tasks(task_manager):
+    """Test count_tasks agrees with the length of filter_tasks."""
+    task_manager.add_task("Write report", priority="high", tags=["work"])
+    task_manager.add_task("Clean kitchen", priority="low", tags=["home"])
+    done = task_manager.add_task("Plan week", priority="high", tags=["work"])
+    task_manager.mark_complete(done.id)
+    for criteria in [{}, {"priority": "high"}, {"tags": ["work"]}, {"status": "active", "priority": "high"}]:
+        assert task_manager.count_tasks(**criteria) == len(task_manager.filter_tasks(**criteria))
+
+
+def test_version_changes_on_every_modification(task_manager):
+    """Test the version counter advances on adds, updates, completions, and deletes only."""
+    versions = [task_manager.version]
+    task = task_manager.add_task("Test task")
+    versions.append(task_manager.version)
+    task_manager.update_task(task.id, new_priority="high")
+    versions.append(task_manager.version)
+    task_manager.mark_complete(task.id)
+    versions.append(task_manager.version)
+    task_manager.delete_task(task.id)
+    versions.append(task_manager.version)
+    assert len(set(versions)) == len(versions)
+
+    task_manager.get_all_tasks()
+    task_manager.filter_tasks(priority="high")
+    task_manager.delete_task(999)
+    assert task_manager.version == versions[-1]
+
+
+def test_sort_tasks_by_priority_after_update(task_manager):
+    """Test priority sorting reflects updated priorities."""
+    low = task_manager.add_task("Low task", priority="low")
+    none = task_manager.add_task("No priority task")
+    high = task_manager.add_task("High task", priority="high")
+    task_manager.update_task(none.id, new_priority="medium")
+    assert task_manager.sort_tasks("priority", reverse=True) == [high, none, low]
+
+
+def test_calculate_next_due_date_monthly_clamps_to_month_end(task_manager):
+    """Test monthly recurrence keeps the day where possible and clamps to shorter months."""
+    assert task_manager.calculate_next_due_date("2024-01-31T09:00:00", "monthly") == "2024-02-29T09:00:00"
+    assert task_manager.calculate_next_due_date("2023-01-31T09:00:00", "monthly") == "2023-02-28T09:00:00"
+    assert task_manager.calculate_next_due_date("2024-12-15T09:00:00", "monthly") == "2025-01-15T09:00:00"
+
+
+def test_mark_complete(task_manager):
+    """Test marking a task as complete."""
+    task = task_manager.add_task("Test task")
+    assert task.completed is False
+
+    marked = task_manager.mark_complete(task.id)
+    assert marked is True
+
+    updated_task = task_manager.get_task_by_id(task.id)
+    assert updated_task.completed is True
+
+
+def test_mark_complete_not_found(task_manager):
+    """Test marking a task as complete when it doesn't exist."""
+    result = task_manager.mark_complete(999)
+    assert result is False
+
+
+def test_mark_incomplete(task_manager):
+    """Test marking a task as incomplete."""
+    task = task_manager.add_task("Test task")
+    # First mark it complete
+    task_manager.mark_complete(task.id)
+    assert task.completed is True
+
+    marked = task_manager.mark_incomplete(task.id)
+    assert marked is True
+
+    updated_task = task_manager.get_task_by_id(task.id)
+    assert updated_task.completed is False
+
+
+def test_mark_incomplete_not_found(task_manager):
+    """Test marking a task as incomplete when it doesn't exist."""
+    result = task_manager.mark_incomplete(999)
+    assert result is False
+
+
+def test_id_generation_sequential(task_manager):
+    """Test that task IDs are generated sequentially."""
+    task1 = task_manager.add_task("Task 1")
+    task2 = task_manager.add_task("Task 2")
+    task3 = task_manager.add_task("Task 3")
+
+    assert task1.id == 1
+    assert task2.id == 2
+    assert task3.id == 3
+
+
+# CLIInterface
+def test_display_menu_no_exception(cli):
+    """Test that display_menu doesn't raise an exception."""
+    # This test simply ensures the method can be called without error
+    # In a real implementation, we would mock print() to capture output
+    try:
+        cli.display_menu()
+        assert True  # If we reach this, no exception was raised
+    except Exception:
+        assert False, "display_menu raised an exception"
+
+
+def test_add_task_cli(task_manager, cli, feed_stdin, capsys):
+    """Test adding a task through CLI interface."""
+    # Enter "Test task" and accept the defaults for the remaining prompts
+    feed_stdin(["Test task", "", "", "", ""])
+
+    cli.add_task_cli()
+
+    # Verify task was added
+    tasks = task_manager.get_all_tasks()
+    assert len(tasks) == 1
+    assert tasks[0].description == "Test task"
+
+    # Verify success message was printed
+    output = capsys.readouterr().out
+    assert "Task added successfully" in output
+
+
+def test_add_task_cli_single_line(task_manager, cli, feed_stdin, capsys):
+    """Test adding a task with all fields given on one "|"-separated line."""
+    feed_stdin(["Pay rent | pri=high | tags=home, bills | due=2026-02-01 09:00 | rec=monthly"])
+
+    cli.add_task_cli()
+
+    tasks = task_manager.get_all_tasks()
+    assert len(tasks) == 1
+    assert tasks[0].description == "Pay rent"
+    assert tasks[0].priority == "high"
+    assert tasks[0].tags == ["home", "bills"]
+    assert tasks[0].due_date == "2026-02-01T09:00:00"
+    assert tasks[0].recurrence == "monthly"
+    assert "Task added successfully" in capsys.readouterr().out
+
 
-    def test_update_task_whitespace_description(self):
-        """Test updating a task with whitespace-only description raises ValueError."""
-        task = self.task_manager.add_task("Original task")
+def test_add_task_cli_plain_description_with_pipe(task_manager, cli, feed_stdin):
+    """Test a description containing "|" but no task fields uses the interactive prompts."""
+    feed_stdin(["Compare A|B toggle", "1", "ui", "", "1"])
+
+    cli.add_task_cli()
+
+    tasks = task_manager.get_all_tasks()
+    assert len(tasks) == 1
+    assert tasks[0].description == "Compare A|B toggle"
+    assert tasks[0].priority == "high"
+    assert tasks[0].tags == ["ui"]
+
+
+def test_parse_task_line_rejects_unknown_field(cli):
+    """Test a one-line task entry with an unrecognized field raises ValueError."""
+    with pytest.raises(ValueError):
+        cli.parse_task_line("Pay rent | colour=red")
+
+
+def test_parse_advanced_query(cli):
+    """Test one-line advanced queries fill in every criterion, with defaults for omitted keys."""
+    assert cli.parse_advanced_query("q=report status=active pri=HIGH tags=work,home sort=title-desc") == (
+        "report", "active", "high", ["work", "home"], "title", True
+    )
+    assert cli.parse_advanced_query("sort=due_date") == ("", None, None, [], "due_date", False)
+    for text in ["colour=red", "status=active status=completed", "pri=urgent", "sort=size"]:
         with pytest.raises(ValueError):
-            self.task_manager.update_task(task.id, "   ")
-
-    def test_update_task_not_found(self):
-        """Test updating a task that doesn't exist."""
-        result = self.task_manager.update_task(999, "New description")
-        assert result is False
-
-    def test_delete_task(self):
-        """Test deleting an existing task."""
-        task = self.task_manager.add_task("Test task")
-        deleted = self.task_manager.delete_task(task.id)
-        assert deleted is True
-        assert self.task_manager.get_task_by_id(task.id) is None
-
-    def test_delete_task_not_found(self):
-        """Test deleting a task that doesn't exist."""
-        result = self.task_manager.delete_task(999)
-        assert result is False
-
-    def test_mark_complete(self):
-        """Test marking a task as complete."""
-        task = self.task_manager.add_task("Test task")
-        assert task.completed is False
-
-        marked = self.task_manager.mark_complete(task.id)
-        assert marked is True
-
-        updated_task = self.task_manager.get_task_by_id(task.id)
-        assert updated_task.completed is True
-
-    def test_mark_complete_not_found(self):
-        """Test marking a task as complete when it doesn't exist."""
-        result = self.task_manager.mark_complete(999)
-        assert result is False
-
-    def test_mark_incomplete(self):
-        """Test marking a task as incomplete."""
-        task = self.task_manager.add_task("Test task")
-        # First mark it complete
-        self.task_manager.mark_complete(task.id)
-        assert task.completed is True
-
-        marked = self.task_manager.mark_incomplete(task.id)
-        assert marked is True
-
-        updated_task = self.task_manager.get_task_by_id(task.id)
-        assert updated_task.completed is False
-
-    def test_mark_incomplete_not_found(self):
-        """Test marking a task as incomplete when it doesn't exist."""
-        result = self.task_manager.mark_incomplete(999)
-        assert result is False
-
-    def test_id_generation_sequential(self):
-        """Test that task IDs are generated sequentially."""
-        task1 = self.task_manager.add_task("Task 1")
-        task2 = self.task_manager.add_task("Task 2")
-        task3 = self.task_manager.add_task("Task 3")
-
-        assert task1.id == 1
-        assert task2.id == 2
-        assert task3.id == 3
-
-
-class TestCLIInterface:
-    """Test the CLIInterface functionality."""
-
-    def setup_method(self):
-        """Set up a fresh TaskManager and CLIInterface for each test."""
-        self.task_manager = TaskManager()
-        self.cli = CLIInterface(self.task_manager)
-
-    def test_display_menu_no_exception(self):
-        """Test that display_menu doesn't raise an exception."""
-        # This test simply ensures the method can be called without error
-        # In a real implementation, we would mock print() to capture output
-        try:
-            self.cli.display_menu()
-            assert True  # If we reach this, no exception was raised
-        except Exception:
-            assert False, "display_menu raised an exception"
-
-    def test_add_task_cli(self, monkeypatch):
-        """Test adding a task through CLI interface."""
-        # Mock input to simulate user entering "Test task"
-        monkeypatch.setattr('builtins.input', lambda _: "Test task")
-
-        # Capture print output
-        import io
-        import sys
-        captured_output = io.StringIO()
-        sys.stdout = captured_output
-
-        self.cli.add_task_cli()
-
-        # Restore stdout
-        sys.stdout = sys.__stdout__
-
-        # Verify task was added
-        tasks = self.task_manager.get_all_tasks()
-        assert len(tasks) == 1
-        assert tasks[0].description == "Test task"
-
-        # Verify success message was printed
-        output = captured_output.getvalue()
-        assert "Task added successfully" in output
-
-    def test_add_task_cli_empty_description(self, monkeypatch):
-        """Test adding a task with empty description through CLI."""
-        # Mock input to simulate user entering empty string
-        monkeypatch.setattr('builtins.input', lambda _: "")
-
-        # Capture print output
-        import io
-        import sys
-        captured_output = io.StringIO()
-        sys.stdout = captured_output
-
-        self.cli.add_task_cli()
-
-        # Restore stdout
-        sys.stdout = sys.__stdout__
-
-        # Verify no task was added
-        tasks = self.task_manager.get_all_tasks()
-        assert len(tasks) == 0
-
-        # Verify error message was printed
-        output = captured_output.getvalue()
-        assert "Error:" in output
-
-    def test_view_task_list_cli_empty(self, monkeypatch):
-        """Test viewing an empty task list through CLI."""
-        # Capture print output
-        import io
-        import sys
-        captured_output = io.StringIO()
-        sys.stdout = captured_output
-
-        self.cli.view_task_list_cli()
-
-        # Restore stdout
-        sys.stdout = sys.__stdout__
-
-        # Verify appropriate message was printed
-        output = captured_output.getvalue()
-        assert "Your task list is empty" in output
-
-    def test_view_task_list_cli_with_tasks(self, monkeypatch):
-        """Test viewing a task list with tasks through CLI."""
-        # Add some tasks
-        self.task_manager.add_task("Task 1")
-        self.task_manager.add_task("Task 2")
-
-        # Capture print output
-        import io
-        import sys
-        captured_output = io.StringIO()
-        sys.stdout = captured_output
-
-        self.cli.view_task_list_cli()
-
-        # Restore stdout
-        sys.stdout = sys.__stdout__
-
-        # Verify tasks were printed
-        output = captured_output.getvalue()
-        assert "Task 1" in output
-        assert "Task 2" in output
-        assert "[ ]" in output  # Incomplete status
-
-    def test_update_task_cli(self, monkeypatch):
-        """Test updating a task through CLI interface."""
-        # Add a task first
-        task = self.task_manager.add_task("Original task")
-
-        # Mock input to simulate user entering task ID and new description
-        inputs = iter([str(task.id), "Updated task"])
-        monkeypatch.setattr('builtins.input', lambda _: next(inputs))
-
-        # Capture print output
-        import io
-        import sys
-        captured_output = io.StringIO()
-        sys.stdout = captured_output
-
-        self.cli.update_task_cli()
-
-        # Restore stdout
-        sys.stdout = sys.__stdout__
+            cli.parse_advanced_query(text)
+
+
+def test_add_task_cli_empty_description(task_manager, cli, feed_stdin, capsys):
+    """Test adding a task with empty description through CLI."""
+    # Enter an empty description and accept the defaults for the remaining prompts
+    feed_stdin(["", "", "", "", ""])
+
+    cli.add_task_cli()
+
+    # Verify no task was added
+    tasks = task_manager.get_all_tasks()
+    assert len(tasks) == 0
+
+    # Verify error message was printed
+    output = capsys.readouterr().out
+    assert "Error:" in output
+
+
+def test_view_task_list_cli_empty(cli, capsys):
+    """Test viewing an empty task list through CLI."""
+    cli.view_task_list_cli()
+
+    # Verify appropriate message was printed
+    output = capsys.readouterr().out
+    assert "Your task list is empty" in output
+
+
+def test_view_task_list_cli_with_tasks(populated_manager, capsys):
+    """Test viewing a task list with tasks through CLI."""
+    cli = CLIInterface(populated_manager)
+
+    cli.view_task_list_cli()
+
+    # Verify tasks were printed
+    output = capsys.readouterr().out
+    assert "Task 1" in output
+    assert "Task 2" in output
+    assert "[ ]" in output  # Incomplete status
+
+
+def test_update_task_cli(task_manager, cli, feed_stdin, capsys):
+    """Test updating a task through CLI interface."""
+    # Add a task first
+    task = task_manager.add_task("Original task")
+
+    # Enter task ID, update only the description
+    feed_stdin([str(task.id), "y", "Updated task", "n", "n", "n", "n"])
+
+    cli.update_task_cli()
+
+    # Verify task was updated
+    updated_task = task_manager.get_task_by_id(task.id)
+    assert updated_task.description == "Updated task"
+
+    # Verify success message was printed
+    output = capsys.readouterr().out
+    assert "updated successfully" in output
+
+
+def test_update_task_cli_due_date(task_manager, cli, feed_stdin, capsys):
+    """Test updating a task's due date through CLI, including unpadded input."""
+    task = task_manager.add_task("Dated task")
+
+    feed_stdin([str(task.id), "n", "n", "n", "y", "2026-01-05 14:30", "n"])
+    cli.update_task_cli()
+    assert task_manager.get_task_by_id(task.id).due_date == "2026-01-05T14:30:00"
+
+    feed_stdin([str(task.id), "n", "n", "n", "y", "2026-2-7 9:05", "n"])
+    cli.update_task_cli()
+    assert task_manager.get_task_by_id(task.id).due_date == "2026-02-07T09:05:00"
+    assert "Invalid date format" not in capsys.readouterr().out
+
+
+def test_update_task_cli_rejects_offset_and_date_only_due_dates(task_manager, cli, feed_stdin, capsys):
+    """Test due dates with a UTC offset or without a time are rejected rather than stored."""
+    task = task_manager.add_task("Dated task")
+
+    for due_input in ["2026-01-05 14:30+02:00", "2026-01-05 14:30Z", "2026-01-05", "20260105"]:
+        feed_stdin([str(task.id), "n", "n", "n", "y", due_input, "n"])
+        cli.update_task_cli()
+        assert task_manager.get_task_by_id(task.id).due_date is None
+        assert "Invalid date format" in capsys.readouterr().out
+
+
+def test_parse_task_line_rejects_offset_due_date(cli):
+    """Test a one-line task entry rejects a due date with a UTC offset."""
+    with pytest.raises(ValueError, match="YYYY-MM-DD HH:MM"):
+        cli.parse_task_line("Pay rent | due=2026-02-01 09:00+00:00")
+
+
+def test_update_task_cli_not_found(cli, feed_stdin, capsys):
+    """Test updating a non-existent task through CLI."""
+    # Enter a task ID that doesn't exist
+    feed_stdin(["999"])
+
+    cli.update_task_cli()
+
+    # Verify error message was printed
+    output = capsys.readouterr().out
+    assert "not found" in output
+
+
+def test_delete_task_cli(task_manager, cli, feed_stdin, capsys):
+    """Test deleting a task through CLI interface."""
+    # Add a task first
+    task = task_manager.add_task("Task to delete")
+
+    # Enter task ID and confirm deletion
+    feed_stdin([str(task.id), "y"])
+
+    cli.delete_task_cli()
+
+    # Verify task was deleted
+    assert task_manager.get_task_by_id(task.id) is None
+
+    # Verify success message was printed
+    output = capsys.readouterr().out
+    assert "deleted successfully" in output
+
+
+def test_delete_task_cli_confirm_ignores_case_and_spaces(task_manager, cli, feed_stdin):
+    """Test the delete confirmation accepts "yes" regardless of case and surrounding spaces."""
+    task = task_manager.add_task("Task to delete")
+
+    feed_stdin([str(task.id), " YES "])
+    cli.delete_task_cli()
+
+    assert task_manager.get_task_by_id(task.id) is None
+
+
+def test_delete_task_cli_cancel(task_manager, cli, feed_stdin, capsys):
+    """Test canceling task deletion through CLI."""
+    # Add a task first
+    task = task_manager.add_task("Task to delete")
+
+    # Enter task ID and cancel deletion
+    feed_stdin([str(task.id), "n"])
+
+    cli.delete_task_cli()
+
+    # Verify task was not deleted
+    assert task_manager.get_task_by_id(task.id) is not None
+
+    # Verify cancellation message was printed
+    output = capsys.readouterr().out
+    assert "Deletion cancelled" in output
+
+
+def test_delete_task_cli_invalid_id(task_manager, cli, feed_stdin, capsys):
+    """Test entering a non-numeric task ID when deleting through CLI."""
+    task = task_manager.add_task("Task to keep")
+
+    # Enter something that isn't a task ID
+    feed_stdin(["abc"])
+
+    cli.delete_task_cli()
+
+    # Verify nothing was deleted and the user was told why
+    assert task_manager.get_task_by_id(task.id) is not None
+    output = capsys.readouterr().out
+    assert "Invalid task ID" in output
+
+
+def test_mark_task_complete_cli(task_manager, cli, feed_stdin, capsys):
+    """Test marking a task as complete through CLI."""
+    # Add a task first
+    task = task_manager.add_task("Task to complete")
+    assert task.completed is False  # Initially incomplete
+
+    # Enter task ID
+    feed_stdin([str(task.id)])
+
+    cli.mark_task_complete_cli()
+
+    # Verify task was marked complete
+    updated_task = task_manager.get_task_by_id(task.id)
+    assert updated_task.completed is True
+
+    # Verify success message was printed
+    output = capsys.readouterr().out
+    assert "marked as complete" in output
+
+
+def test_mark_task_incomplete_cli(task_manager, cli, feed_stdin, capsys):
+    """Test marking a task as incomplete through CLI."""
+    # Add a task first and mark it complete
+    task = task_manager.add_task("Task to mark incomplete")
+    task_manager.mark_complete(task.id)
+    assert task.completed is True  # Initially complete
+
+    # Enter task ID
+    feed_stdin([str(task.id)])
+
+    cli.mark_task_incomplete_cli()
+
+    # Verify task was marked incomplete
+    updated_task = task_manager.get_task_by_id(task.id)
+    assert updated_task.completed is False
+
+    # Verify success message was printed
+    output = capsys.readouterr().out
+    assert "marked as incomplete" in output
+
+
+def test_advanced_tasks_cli_one_line_query(task_manager, cli, feed_stdin, capsys):
+    """Test a one-line advanced query skips the prompts and applies every criterion."""
+    task_manager.add_task("Write report", priority="low", tags=["work"])
+    task_manager.add_task("Write slides", priority="high", tags=["work"])
+    task_manager.add_task("Write letter", priority="high", tags=["home"])
+
+    feed_stdin(["q=write tags=work sort=priority-asc", "5"])
+
+    cli.advanced_tasks_cli()
+
+    output = capsys.readouterr().out
+    assert "Write letter" not in output
+    assert output.index("Write report") < output.index("Write slides")
+    assert "Sort by: priority, ascending" in output
+
+
+def test_advanced_tasks_cli_zero_is_not_a_query(task_manager, cli, feed_stdin, capsys):
+    """Test menu choice 0 behaves like any other out-of-range number, not like a one-line query."""
+    task_manager.add_task("Write report")
+
+    feed_stdin(["0", "5"])
+    cli.advanced_tasks_cli()
+
+    output = capsys.readouterr().out
+    assert "Unknown query criterion" not in output
+    assert "Write report" in output
+
+
+def test_filter_tasks_cli_reflects_changes_between_runs(task_manager, cli, feed_stdin, capsys):
+    """Test repeated filtering shows tasks changed since the previous run."""
+    task = task_manager.add_task("Write report")
+
+    # Status filter: active only, then back
+    feed_stdin(["1", "2", "7"])
+    cli.filter_tasks_cli()
+    assert "Write report" in capsys.readouterr().out
+
+    task_manager.mark_complete(task.id)
+    feed_stdin(["1", "2", "7"])
+    cli.filter_tasks_cli()
+    assert "Write report" not in capsys.readouterr().out
+
+
+def test_filter_tasks_cli_banner_follows_filter_changes(cli, feed_stdin, capsys):
+    """Test the current filters line is redrawn after a filter changes, but not after invalid input."""
+    feed_stdin(["x", "1", "2", "7"])
+    cli.filter_tasks_cli()
+
+    output = capsys.readouterr().out
+    assert output.count("Current filters - Status: All,") == 2
+    assert output.count("Current filters - Status: active,") == 1
+
+
+def test_sort_tasks_cli_by_due_date(task_manager, cli, feed_stdin, capsys):
+    """Test the sort menu's due date option lists the earliest due task first."""
+    task_manager.add_task("Later task", due_date="2030-06-01T09:00:00")
+    task_manager.add_task("Sooner task", due_date="2030-01-01T09:00:00")
+
+    feed_stdin(["7"])
+    cli.sort_tasks_cli()
+
+    output = capsys.readouterr().out
+    assert "by due_date, ascending" in output
+    assert output.index("Sooner task") < output.index("Later task")
+
+
+def test_advanced_tasks_cli_search_and_filter(task_manager, cli, feed_stdin, capsys):
+    """Test advanced search + filter applies the query, status, and tag criteria together."""
+    task_manager.add_task("Write report", tags=["work"])
+    task_manager.add_task("Write letter", tags=["home"])
+    done = task_manager.add_task("Write summary", tags=["work", "urgent"])
+    task_manager.mark_complete(done.id)
+    task_manager.add_task("Read book", tags=["work"])
+
+    # Search + Filter: query "WRITE", active only, any priority, tags work or urgent, then back
+    feed_stdin(["2", "WRITE", "2", "", "work, urgent", "5"])
 
-        # Verify task was updated
-        updated_task = self.task_manager.get_task_by_id(task.id)
-        assert updated_task.description == "Updated task"
+    cli.advanced_tasks_cli()
 
-        # Verify success message was printed
-        output = captured_output.getvalue()
-        assert "updated successfully" in output
-
-    def test_update_task_cli_not_found(self, monkeypatch):
-        """Test updating a non-existent task through CLI."""
-        # Mock input to simulate user entering invalid task ID
-        inputs = iter(["999", "Updated task"])
-        monkeypatch.setattr('builtins.input', lambda _: next(inputs))
-
-        # Capture print output
-        import io
-        import sys
-        captured_output = io.StringIO()
-        sys.stdout = captured_output
-
-        self.cli.update_task_cli()
-
-        # Restore stdout
-        sys.stdout = sys.__stdout__
-
-        # Verify error message was printed
-        output = captured_output.getvalue()
-        assert "not found" in output
+    output = capsys.readouterr().out
+    assert "Write report" in output
+    assert "Write letter" not in output
+    assert "Write summary" not in output
+    assert "Read book" not in output
 
-    def test_delete_task_cli(self, monkeypatch):
-        """Test deleting a task through CLI interface."""
-        # Add a task first
-        task = self.task_manager.add_task("Task to delete")
-
-        # Mock input to simulate user entering task ID and confirming deletion
-        inputs = iter([str(task.id), "y"])
-        monkeypatch.setattr('builtins.input', lambda _: next(inputs))
-
-        # Capture print output
-        import io
-        import sys
-        captured_output = io.StringIO()
-        sys.stdout = captured_output
 
-        self.cli.delete_task_cli()
+# Integration
+def test_full_workflow(task_manager, cli, feed_stdin):
+    """Test the complete workflow: add, view, update, mark complete, delete."""
+    feed_stdin([
+        "First task", "", "", "", "",                           # add "First task"
+        "Second task", "", "", "", "",                          # add "Second task"
+        "1", "y", "Updated first task", "n", "n", "n", "n",     # update first task
+        "2",                                                    # mark second complete
+        "1", "y",                                               # delete first task
+    ])
 
-        # Restore stdout
-        sys.stdout = sys.__stdout__
+    # Add tasks
+    cli.add_task_cli()  # Add "First task"
+    cli.add_task_cli()  # Add "Second task"
 
-        # Verify task was deleted
-        assert self.task_manager.get_task_by_id(task.id) is None
+    # Verify tasks were added
+    tasks = task_manager.get_all_tasks()
+    assert len(tasks) == 2
+    assert tasks[0].description == "First task"
+    assert tasks[1].description == "Second task"
 
-        # Verify success message was printed
-        output = captured_output.getvalue()
-        assert "deleted successfully" in output
+    # Update first task
+    cli.update_task_cli()
 
-    def test_delete_task_cli_cancel(self, monkeypatch):
-        """Test canceling task deletion through CLI."""
-        # Add a task first
-        task = self.task_manager.add_task("Task to delete")
+    # Verify task was updated
+    updated_task = task_manager.get_task_by_id(1)
+    assert updated_task.description == "Updated first task"
 
-        # Mock input to simulate user entering task ID and canceling deletion
-        inputs = iter([str(task.id), "n"])
-        monkeypatch.setattr('builtins.input', lambda _: next(inputs))
+    # Mark second task as complete
+    cli.mark_task_complete_cli()
 
-        # Capture print output
-        import io
-        import sys
-        captured_output = io.StringIO()
-        sys.stdout = captured_output
+    # Verify task was marked complete
+    completed_task = task_manager.get_task_by_id(2)
+    assert completed_task.completed is True
 
-        self.cli.delete_task_cli()
-
-        # Restore stdout
-        sys.stdout = sys.__stdout__
-
-        # Verify task was not deleted
-        assert self.task_manager.get_task_by_id(task.id) is not None
-
-        # Verify cancellation message was printed
-        output = captured_output.getvalue()
-        assert "Deletion cancelled" in output
-
-    def test_mark_task_complete_cli(self, monkeypatch):
-        """Test marking a task as complete through CLI."""
-        # Add a task first
-        task = self.task_manager.add_task("Task to complete")
-        assert task.completed is False  # Initially incomplete
+    # Delete first task
+    cli.delete_task_cli()
 
-        # Mock input to simulate user entering task ID
-        monkeypatch.setattr('builtins.input', lambda _: str(task.id))
-
-        # Capture print output
-        import io
-        import sys
-        captured_output = io.StringIO()
-        sys.stdout = captured_output
-
-        self.cli.mark_task_complete_cli()
-
-        # Restore stdout
-        sys.stdout = sys.__stdout__
-
-        # Verify task was marked complete
-        updated_task = self.task_manager.get_task_by_id(task.id)
-        assert updated_task.completed is True
-
-        # Verify success message was printed
-        output = captured_output.getvalue()
-        assert "marked as complete" in output
-
-    def test_mark_task_incomplete_cli(self, monkeypatch):
-        """Test marking a task as incomplete through CLI."""
-        # Add a task first and mark it complete
-        task = self.task_manager.add_task("Task to mark incomplete")
-        self.task_manager.mark_complete(task.id)
-        assert task.completed is True  # Initially complete
-
-        # Mock input to simulate user entering task ID
-        monkeypatch.setattr('builtins.input', lambda _: str(task.id))
-
-        # Capture print output
-        import io
-        import sys
-        captured_output = io.StringIO()
-        sys.stdout = captured_output
-
-        self.cli.mark_task_incomplete_cli()
-
-        # Restore stdout
-        sys.stdout = sys.__stdout__
-
-        # Verify task was marked incomplete
-        updated_task = self.task_manager.get_task_by_id(task.id)
-        assert updated_task.completed is False
-
-        # Verify success message was printed
-        output = captured_output.getvalue()
-        assert "marked as incomplete" in output
-
-
-class TestIntegration:
-    """Integration tests for the complete application workflow."""
-
-    def setup_method(self):
-        """Set up a fresh TaskManager and CLIInterface for each test."""
-        self.task_manager = TaskManager()
-        self.cli = CLIInterface(self.task_manager)
-
-    def test_full_workflow(self, monkeypatch):
-        """Test the complete workflow: add, view, update, mark complete, delete."""
-        # Add tasks
-        inputs = iter(["First task", "Second task"])
-        original_input = __builtins__['input']
-        input_iter = iter(inputs)
-
-        def mock_input(prompt):
-            if "Enter task description:" in prompt:
-                return next(input_iter)
-            return original_input(prompt)
-
-        __builtins__['input'] = mock_input
-
-        try:
-            self.cli.add_task_cli()  # Add "First task"
-            self.cli.add_task_cli()  # Add "Second task"
-        finally:
-            __builtins__['input'] = original_input
-
-        # Verify tasks were added
-        tasks = self.task_manager.get_all_tasks()
-        assert len(tasks) == 2
-        assert tasks[0].description == "First task"
-        assert tasks[1].description == "Second task"
-
-        # Update first task
-        inputs = iter(["1", "Updated first task"])
-        input_iter = iter(inputs)
-        __builtins__['input'] = lambda _: next(input_iter)
-
-        try:
-            self.cli.update_task_cli()
-        finally:
-            __builtins__['input'] = original_input
-
-        # Verify task was updated
-        updated_task = self.task_manager.get_task_by_id(1)
-        assert updated_task.description == "Updated first task"
-
-        # Mark second task as complete
-        monkeypatch.setattr('builtins.input', lambda _: "2")
-        self.cli.mark_task_complete_cli()
-
-        # Verify task was marked complete
-        completed_task = self.task_manager.get_task_by_id(2)
-        assert completed_task.completed is True
-
-        # Delete first task
-        inputs = iter(["1", "y"])  # Task ID and confirmation
-        input_iter = iter(inputs)
-        __builtins__['input'] = lambda _: next(input_iter)
-
-        try:
-            self.cli.delete_task_cli()
-        finally:
-            __builtins__['input'] = original_input
-
-        # Verify task was deleted and only one remains
-        remaining_tasks = self.task_manager.get_all_tasks()
-        assert len(remaining_tasks) == 1
-        assert remaining_tasks[0].id == 2
-        assert remaining_tasks[0].description == "Second task"
-        assert remaining_tasks[0].completed is True
\ No newline at end of file
+    # Verify task was deleted and only one remains
+    remaining_tasks = task_manager.get_all_tasks()
+    assert len(remaining_tasks) == 1
+    assert remaining_tasks[0].id == 2
+    assert remaining_tasks[0].description == "Second task"
+    assert remaining_tasks[0].completed is True
\ No newline at end of file
@@ -8,12 +8,256 @@ and mark tasks as complete/incomplete. All data is stored in memory during
 runtime and will be lost when the application terminates.
 """
 
-from dataclasses import dataclass
-from typing import List, Optional
-from datetime import datetime
+import re
+import sys
+from calendar import monthrange
+from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import attrgetter
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from datetime import datetime, timedelta
+
+
+# Accepted priority and recurrence values (None is allowed for both and checked separately)
+_ALLOWED_PRIORITIES = frozenset({"high", "medium", "low"})
+_ALLOWED_RECURRENCES = frozenset({"none", "daily", "weekly", "monthly"})
+
+# Sort rank for each priority level: high > medium > low > None
+_PRIORITY_ORDER = {"high": 4, "medium": 3, "low": 2, None: 1}
+
+# Visual indicator for each priority level
+_PRIORITY_INDICATORS = {"high": "[HIGH] High", "medium": "[MED] Medium", "low": "[LOW] Low"}
+_NO_PRIORITY_INDICATOR = "[N/A] No Priority"
+
+# Priority and recurrence for each choice in the selection menus; choice 5 keeps the current value
+_PRIORITY_FROM_CHOICE = {1: "high", 2: "medium", 3: "low", 4: None}
+_RECURRENCE_FROM_CHOICE = {1: "none", 2: "daily", 3: "weekly", 4: "monthly"}
+
+# Completed flag selected by each status filter ("all" and None select both)
+_COMPLETED_FROM_STATUS = {"active": False, "completed": True}
+
+# Filter values for the filter submenu choices (None means no filter)
+_STATUS_FILTER_FROM_CHOICE = {1: None, 2: "active", 3: "completed"}
+_DUE_STATUS_FILTER_FROM_CHOICE = {1: None, 2: "upcoming", 3: "due-soon", 4: "overdue"}
+_RECURRENCE_FILTER_FROM_CHOICE = {1: None, 2: "none", 3: "daily", 4: "weekly", 5: "monthly"}
+
+# Sort field and reverse flag for each sort menu choice
+_SORT_FROM_CHOICE = {
+    1: ("created_at", True),
+    2: ("created_at", False),
+    3: ("priority", True),
+    4: ("priority", False),
+    5: ("title", False),
+    6: ("title", True),
+    7: ("due_date", False),
+    8: ("due_date", True),
+    9: ("due_status", True),
+}
+
+# Keys accepted after the description in a one-line task entry, mapped to add_task arguments
+_TASK_LINE_FIELDS = {"pri": "priority", "tags": "tags", "due": "due_date", "rec": "recurrence"}
+
+# A fully zero-padded "YYYY-MM-DD HH:MM" due date as typed by the user (no seconds or UTC offset)
+_DUE_INPUT_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2} [0-9]{2}:[0-9]{2}")
+
+# One "key=value" criterion in a one-line advanced query
+_ADVANCED_QUERY_RE = re.compile(r"(q|status|pri|tags|sort)=(\S+)")
+
+# Sort fields accepted in an advanced query, mapped to their default direction (reverse flag)
+_ADVANCED_SORT_FIELDS = {"created_at": True, "priority": True, "title": False, "due_date": False, "due_status": True}
+
+# Answers accepted as "yes" at confirmation prompts; the update prompts also treat an empty answer as yes
+_YES = frozenset(("y", "yes"))
+_YES_OR_EMPTY = _YES | {""}
+
+# Completion checkbox, indexed by Task.completed
+_STATUS = ("[ ]", "[x]")
+
+# Separator lines for the detailed (with due date/recurrence) and compact task listings
+_SEP_WIDE = "-" * 100
+_SEP_NARROW = "-" * 80
+
+# Main menu banner, built once at import time
+_MENU = "\n".join([
+    "\n" + "=" * 40,
+    "Todo Application - Main Menu",
+    "=" * 40,
+    "1. Add Task",
+    "2. View Task List",
+    "3. Update Task",
+    "4. Delete Task",
+    "5. Mark Task Complete",
+    "6. Mark Task Incomplete",
+    "7. Search Tasks",
+    "8. Filter Tasks",
+    "9. Sort Tasks",
+    "10. Advanced Search/Filter/Sort",
+    "11. Exit",
+    "=" * 40,
+])
+
+# Submenus, each printed with a single call
+_PRIORITY_MENU = "\n".join([
+    "\nSelect Priority:",
+    "1. High ([HIGH])",
+    "2. Medium ([MED])",
+    "3. Low ([LOW])",
+    "4. No Priority ([N/A])",
+    "5. Keep current priority",
+])
+
+_RECURRENCE_MENU = "\n".join([
+    "\nSelect Recurrence:",
+    "1. No Recurrence",
+    "2. Daily",
+    "3. Weekly",
+    "4. Monthly",
+    "5. Keep current recurrence",
+])
+
+_FILTER_MENU = "\n".join([
+    "\nFilter Options:",
+    "1. Filter by Status",
+    "2. Filter by Priority",
+    "3. Filter by Tags",
+    "4. Filter by Due Date Status",
+    "5. Filter by Recurrence",
+    "6. Clear all filters",
+    "7. Back to main menu",
+])
+
+_SORT_MENU = "\n".join([
+    "\nSort Options:",
+    "1. Sort by Creation Date (Newest first)",
+    "2. Sort by Creation Date (Oldest first)",
+    "3. Sort by Priority (High to Low)",
+    "4. Sort by Priority (Low to High)",
+    "5. Sort by Title (A-Z)",
+    "6. Sort by Title (Z-A)",
+    "7. Sort by Due Date (Earliest first)",
+    "8. Sort by Due Date (Latest first)",
+    "9. Sort by Due Status (Overdue first)",
+])
+
+_ADVANCED_MENU = "\n".join([
+    "\nAdvanced Options:",
+    "1. Search + Filter + Sort",
+    "2. Search + Filter",
+    "3. Search + Sort",
+    "4. Filter + Sort",
+    "5. Back to main menu",
+])
+
+
+# Due date status codes, ordered so that a higher code is more urgent
+DUE_NONE = 0
+DUE_UPCOMING = 1
+DUE_SOON = 2
+DUE_OVERDUE = 3
+
+# How far ahead a due date counts as "due soon" rather than "upcoming"
+_DUE_SOON_WINDOW = timedelta(hours=1)
+
+# Sort key for tasks without a due date, placing them after every ISO date string
+_NO_DUE_DATE_SORT_KEY = datetime.max.isoformat()
+
+# Status text and color indicator for each due date status code
+_DUE_STATUS_DISPLAY = (
+    ("", ""),
+    ("UPCOMING", "[GREEN] Upcoming"),
+    ("DUE-SOON", "[YELLOW] Due Soon"),
+    ("OVERDUE", "[RED] Overdue"),
+)
+
+
+def _normalize_iso(due_date: str) -> str:
+    """Rewrite a trailing "Z" UTC designator as "+00:00", which fromisoformat accepts on Python < 3.11."""
+    if due_date.endswith("Z"):
+        return due_date[:-1] + "+00:00"
+    return due_date
+
+
+def _parse_due_input(text: str) -> str:
+    """
+    Convert a user-entered "YYYY-MM-DD HH:MM" due date to an ISO format string.
+
+    Args:
+        text (str): The date as typed by the user
+
+    Returns:
+        str: The due date in ISO format
+
+    Raises:
+        ValueError: If the text is not a recognizable date/time
+    """
+    text = text.strip()
+    if _DUE_INPUT_RE.fullmatch(text):
+        # Exactly "YYYY-MM-DD HH:MM", which fromisoformat parses far faster than strptime
+        return datetime.fromisoformat(text).isoformat()
+    # strptime also accepts unpadded fields such as "2026-1-5 9:30", and rejects offsets, seconds, and date-only input
+    return datetime.strptime(text, "%Y-%m-%d %H:%M").isoformat()
+
+
+@lru_cache(maxsize=4096)
+def _parse_due_date(due_date: str) -> datetime:
+    """Parse a normalized ISO format due date string, memoized per distinct string."""
+    return datetime.fromisoformat(due_date)
+
+
+def _validate_tags(tags: List[str]):
+    """Check a task's tag list against the count and length limits, raising ValueError on the first problem."""
+    if len(tags) > 10:
+        raise ValueError("Tasks cannot have more than 10 tags")
+    for tag in tags:
+        if len(tag) > 30:
+            raise ValueError("Tags cannot be longer than 30 characters")
+        if not tag.strip():
+            raise ValueError("Tags cannot be empty or contain only whitespace")
 
 
-@dataclass
+def classify_due_date(due: Optional[datetime], now: datetime) -> int:
+    """
+    Classify a parsed due date relative to the given current time.
+
+    Args:
+        due (Optional[datetime]): Parsed due date or None
+        now (datetime): The current time to compare against
+
+    Returns:
+        int: One of DUE_NONE, DUE_UPCOMING, DUE_SOON, or DUE_OVERDUE
+    """
+    if due is None:
+        return DUE_NONE
+    if due < now:
+        return DUE_OVERDUE
+    if due - now <= _DUE_SOON_WINDOW:
+        return DUE_SOON
+    return DUE_UPCOMING
+
+
+def _add_month(current_date: datetime) -> datetime:
+    """Return the same day and time one month later, clamped to the last day of a shorter month."""
+    # Handle month overflow by adding one month
+    year = current_date.year
+    month = current_date.month + 1
+    if month > 12:
+        month = 1
+        year += 1
+
+    # Clamp days that don't exist in the next month (e.g., Jan 31 -> Feb 28/29)
+    max_day = monthrange(year, month)[1]
+    return current_date.replace(year=year, month=month, day=min(current_date.day, max_day))
+
+
+# Function advancing a due date by one period, for each recurrence pattern
+_RECURRENCE_STEPS = {
+    "daily": lambda current_date: current_date + timedelta(days=1),
+    "weekly": lambda current_date: current_date + timedelta(weeks=1),
+    "monthly": _add_month,
+}
+
+
+@dataclass(eq=False, slots=True)
 class Task:
     """
     Represents a single todo task with ID, description, completion status, priority, tags, due date, and recurrence.
@@ -38,6 +282,9 @@ class Task:
     due_date: Optional[str] = None  # Due date/time in ISO format
     recurrence: Optional[str] = "none"  # "none", "daily", "weekly", "monthly", or None
     last_completed: Optional[str] = None  # Timestamp when last completed
+    _desc_folded: str = field(default="", init=False, repr=False, compare=False)  # Cached casefolded description for searching
+    _priority_ord: int = field(default=1, init=False, repr=False, compare=False)  # Cached priority sort rank
+    _due_dt: Optional[datetime] = field(default=None, init=False, repr=False, compare=False)  # Cached parsed due date
 
     def __post_init__(self):
         if self.tags is None:
@@ -46,6 +293,13 @@ class Task:
             self.created_at = datetime.now().isoformat()
         if self.recurrence is None:
             self.recurrence = "none"
+        self._desc_folded = self.description.casefold()
+        self._priority_ord = _PRIORITY_ORDER.get(self.priority, 1)
+        if self.due_date:
+            self.due_date = _normalize_iso(self.due_date)
+            self._due_dt = _parse_due_date(self.due_date)
+        else:
+            self._due_dt = None
 
 
 class TaskManager:
@@ -54,9 +308,52 @@ class TaskManager:
     """
 
     def __init__(self):
-        """Initialize the TaskManager with an empty task list and ID counter."""
-        self._tasks: List[Task] = []
+        """Initialize the TaskManager with an empty task store, ID counter, and tag/priority/status indexes."""
+        self._tasks: Dict[int, Task] = {}  # Tasks keyed by ID, in insertion order
         self._next_id: int = 1
+        self._tag_index: Dict[str, Set[int]] = {}  # Maps each tag to the IDs of tasks carrying it
+        self._priority_index: Dict[Optional[str], Set[int]] = {}  # Maps each priority to the IDs of tasks with it
+        self._status_index: Dict[bool, Set[int]] = {False: set(), True: set()}  # Maps completed flag to task IDs
+        self._snapshot: Optional[Tuple[Task, ...]] = None  # Cached get_all_tasks result; reset when tasks are added or removed
+        self._version: int = 0  # Incremented on every change to the stored tasks
+
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever a task is added, updated, deleted, or (un)completed."""
+        return self._version
+
+    def _index_tags(self, task: Task):
+        """Add a task's tags to the tag index."""
+        for tag in task.tags:
+            self._tag_index.setdefault(tag, set()).add(task.id)
+
+    def _unindex_tags(self, task: Task):
+        """Remove a task's tags from the tag index."""
+        for tag in task.tags:
+            task_ids = self._tag_index.get(tag)
+            if task_ids is not None:
+                task_ids.discard(task.id)
+                if not task_ids:
+                    del self._tag_index[tag]
+
+    def _index_task(self, task: Task):
+        """Add a task to the tag, priority, and status indexes."""
+        self._index_tags(task)
+        self._priority_index.setdefault(task.priority, set()).add(task.id)
+        self._status_index[task.completed].add(task.id)
+
+    def _unindex_task(self, task: Task):
+        """Remove a task from the tag, priority, and status indexes."""
+        self._unindex_tags(task)
+        self._priority_index[task.priority].discard(task.id)
+        self._status_index[task.completed].discard(task.id)
+
+    def _set_completed(self, task: Task, completed: bool):
+        """Set a task's completion flag, moving it to the matching status index."""
+        self._status_index[task.completed].discard(task.id)
+        self._version += 1
+        task.completed = completed
+        self._status_index[completed].add(task.id)
 
     def add_task(self, description: str, priority: Optional[str] = None, tags: Optional[List[str]] = None, due_date: Optional[str] = None, recurrence: Optional[str] = "none") -> Task:
         """
@@ -76,48 +373,98 @@ class TaskManager:
             ValueError: If description is empty or contains only whitespace
             ValueError: If priority is not one of the allowed values
             ValueError: If recurrence is not one of the allowed values
+            ValueError: If due date is not a valid ISO format date/time
         """
-        if not description or description.strip() == "":
+        if tags is None:
+            tags = []
+        description = description.strip() if description else ""
+        self._validate_new_task(description, priority, tags, due_date, recurrence)
+        return self._store_new_task(description, priority, tags, due_date, recurrence)
+
+    def add_tasks(self, specs: Iterable[tuple]) -> List[Task]:
+        """
+        Add several tasks at once. All specs are validated before any task is added.
+
+        Args:
+            specs (Iterable[tuple]): One tuple of add_task positional arguments per task,
+                e.g. (description, priority, tags)
+
+        Returns:
+            List[Task]: The newly created tasks, in the order given
+
+        Raises:
+            ValueError: If any spec fails add_task validation; no tasks are added in that case
+        """
+        def with_defaults(description, priority=None, tags=None, due_date=None, recurrence="none"):
+            description = description.strip() if description else ""
+            return description, priority, [] if tags is None else tags, due_date, recurrence
+
+        validated = []
+        for spec in specs:
+            fields = with_defaults(*spec)
+            self._validate_new_task(*fields)
+            validated.append(fields)
+        return [self._store_new_task(*fields) for fields in validated]
+
+    def _validate_new_task(self, description: str, priority: Optional[str], tags: List[str], due_date: Optional[str], recurrence: Optional[str]):
+        """Validate the fields of a task about to be added (description already stripped), raising ValueError on the first problem."""
+        if not description:
             raise ValueError("Task description cannot be empty or contain only whitespace")
 
-        if priority is not None and priority not in ["high", "medium", "low"]:
+        if priority is not None and priority not in _ALLOWED_PRIORITIES:
             raise ValueError("Priority must be one of: 'high', 'medium', 'low', or None")
 
-        if recurrence is not None and recurrence not in ["none", "daily", "weekly", "monthly"]:
+        if recurrence is not None and recurrence not in _ALLOWED_RECURRENCES:
             raise ValueError("Recurrence must be one of: 'none', 'daily', 'weekly', 'monthly', or None")
 
-        if tags is None:
-            tags = []
+        if due_date is not None:
+            try:
+                _parse_due_date(_normalize_iso(due_date))
+            except ValueError:
+                raise ValueError("Due date must be a valid ISO format date/time")
 
-        # Validate tags
-        if len(tags) > 10:
-            raise ValueError("Tasks cannot have more than 10 tags")
-        for tag in tags:
-            if len(tag) > 30:
-                raise ValueError("Tags cannot be longer than 30 characters")
-            if not tag.strip():
-                raise ValueError("Tags cannot be empty or contain only whitespace")
+        _validate_tags(tags)
 
+    def _store_new_task(self, description: str, priority: Optional[str], tags: List[str], due_date: Optional[str], recurrence: Optional[str]) -> Task:
+        """Create an already-validated task with the next ID and add it to storage."""
         task = Task(
             id=self._next_id,
-            description=description.strip(),
+            description=description,
             priority=priority,
             tags=tags.copy(),  # Copy to avoid reference issues
             due_date=due_date,
             recurrence=recurrence
         )
-        self._tasks.append(task)
-        self._next_id += 1
+        self._insert_task(task)
         return task
 
-    def get_all_tasks(self) -> List[Task]:
+    def _insert_task(self, task: Task):
+        """Add a task created with the next ID to storage and the indexes, then advance the ID counter."""
+        self._tasks[task.id] = task
+        self._snapshot = None
+        self._version += 1
+        self._index_task(task)
+        self._next_id += 1
+
+    def get_all_tasks(self) -> Tuple[Task, ...]:
         """
         Retrieve all tasks from storage.
 
         Returns:
-            List[Task]: All tasks in the storage
+            Tuple[Task, ...]: All tasks in the storage, as a read-only sequence
         """
-        return self._tasks.copy()
+        if self._snapshot is None:
+            self._snapshot = tuple(self._tasks.values())
+        return self._snapshot
+
+    def iter_tasks(self) -> Iterator[Task]:
+        """
+        Iterate over all tasks in storage without copying them.
+
+        Returns:
+            Iterator[Task]: Iterator over the stored tasks, in insertion order
+        """
+        return iter(self._tasks.values())
 
     def get_task_by_id(self, task_id: int) -> Optional[Task]:
         """
@@ -129,10 +476,7 @@ class TaskManager:
         Returns:
             Task or None: The task with the specified ID, or None if not found
         """
-        for task in self._tasks:
-            if task.id == task_id:
-                return task
-        return None
+        return self._tasks.get(task_id)
 
     def update_task(self, task_id: int, new_description: Optional[str] = None, new_priority: Optional[str] = None, new_tags: Optional[List[str]] = None, new_due_date: Optional[str] = None, new_recurrence: Optional[str] = None) -> bool:
         """
@@ -153,42 +497,51 @@ class TaskManager:
             ValueError: If new description is empty or contains only whitespace
             ValueError: If priority is not one of the allowed values
             ValueError: If recurrence is not one of the allowed values
+            ValueError: If due date is not a valid ISO format date/time
         """
-        task = self.get_task_by_id(task_id)
-        if not task:
+        task = self._tasks.get(task_id)
+        if task is None:
             return False
+        # Bump before changing anything, since a later invalid field can raise after earlier ones are applied
+        self._version += 1
 
         # Update description if provided
         if new_description is not None:
-            if not new_description or new_description.strip() == "":
+            stripped = new_description.strip()
+            if not stripped:
                 raise ValueError("Task description cannot be empty or contain only whitespace")
-            task.description = new_description.strip()
+            task.description = stripped
+            task._desc_folded = task.description.casefold()
 
         # Update priority if provided
         if new_priority is not None:
-            if new_priority not in ["high", "medium", "low", None]:
+            if new_priority not in _ALLOWED_PRIORITIES:
                 raise ValueError("Priority must be one of: 'high', 'medium', 'low', or None")
+            self._priority_index[task.priority].discard(task.id)
             task.priority = new_priority
+            self._priority_index.setdefault(new_priority, set()).add(task.id)
+            task._priority_ord = _PRIORITY_ORDER[new_priority]
 
         # Update tags if provided
         if new_tags is not None:
-            # Validate tags
-            if len(new_tags) > 10:
-                raise ValueError("Tasks cannot have more than 10 tags")
-            for tag in new_tags:
-                if len(tag) > 30:
-                    raise ValueError("Tags cannot be longer than 30 characters")
-                if not tag.strip():
-                    raise ValueError("Tags cannot be empty or contain only whitespace")
+            _validate_tags(new_tags)
+            self._unindex_tags(task)
             task.tags = new_tags.copy()
+            self._index_tags(task)
 
         # Update due date if provided
         if new_due_date is not None:
+            new_due_date = _normalize_iso(new_due_date)
+            try:
+                due_dt = _parse_due_date(new_due_date)
+            except ValueError:
+                raise ValueError("Due date must be a valid ISO format date/time")
             task.due_date = new_due_date
+            task._due_dt = due_dt
 
         # Update recurrence if provided
         if new_recurrence is not None:
-            if new_recurrence not in ["none", "daily", "weekly", "monthly", None]:
+            if new_recurrence not in _ALLOWED_RECURRENCES:
                 raise ValueError("Recurrence must be one of: 'none', 'daily', 'weekly', 'monthly', or None")
             task.recurrence = new_recurrence
 
@@ -204,11 +557,13 @@ class TaskManager:
         Returns:
             bool: True if the task was deleted, False if task was not found
         """
-        task = self.get_task_by_id(task_id)
-        if task:
-            self._tasks.remove(task)
-            return True
-        return False
+        task = self._tasks.pop(task_id, None)
+        if task is None:
+            return False
+        self._snapshot = None
+        self._version += 1
+        self._unindex_task(task)
+        return True
 
     def search_tasks(self, query: str) -> List[Task]:
         """
@@ -221,16 +576,11 @@ class TaskManager:
             List[Task]: List of tasks that match the search query
         """
         if not query:
-            return self._tasks.copy()
-
-        query_lower = query.lower().strip()
-        matching_tasks = []
-
-        for task in self._tasks:
-            if query_lower in task.description.lower():
-                matching_tasks.append(task)
+            return list(self._tasks.values())
 
-        return matching_tasks
+        # casefold() also matches case variants lower() misses, e.g. "STRASSE" finds "Straße"
+        query_folded = query.casefold().strip()
+        return [task for task in self._tasks.values() if query_folded in task._desc_folded]
 
     def calculate_next_due_date(self, current_due_date: str, recurrence: str) -> str:
         """
@@ -243,43 +593,11 @@ class TaskManager:
         Returns:
             str: Next due date in ISO format
         """
-        from datetime import datetime, timedelta
-        current_date = datetime.fromisoformat(current_due_date.replace('Z', '+00:00'))
-
-        if recurrence == "daily":
-            next_date = current_date + timedelta(days=1)
-        elif recurrence == "weekly":
-            next_date = current_date + timedelta(weeks=1)
-        elif recurrence == "monthly":
-            # Handle month overflow by adding one month
-            year = current_date.year
-            month = current_date.month + 1
-            if month > 12:
-                month = 1
-                year += 1
-
-            # Handle case where the day doesn't exist in the next month (e.g., Jan 31 -> Feb 31 doesn't exist)
-            day = current_date.day
-            try:
-                next_date = current_date.replace(year=year, month=month, day=day)
-            except ValueError:
-                # If the day doesn't exist (like Feb 31), set to the last day of the month
-                if month == 2:
-                    # Check for leap year
-                    if year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
-                        max_day = 29
-                    else:
-                        max_day = 28
-                elif month in [4, 6, 9, 11]:
-                    max_day = 30
-                else:
-                    max_day = 31
-
-                next_date = current_date.replace(year=year, month=month, day=max_day)
-        else:
-            # This shouldn't happen if properly validated, but return current date as fallback
-            next_date = current_date
+        current_date = _parse_due_date(_normalize_iso(current_due_date))
 
+        # An unknown pattern shouldn't happen if properly validated; fall back to the current date
+        step = _RECURRENCE_STEPS.get(recurrence)
+        next_date = step(current_date) if step else current_date
         return next_date.isoformat()
 
     def mark_complete(self, task_id: int) -> bool:
@@ -292,12 +610,12 @@ class TaskManager:
         Returns:
             bool: True if the task was marked complete, False if task was not found
         """
-        task = self.get_task_by_id(task_id)
-        if not task:
+        task = self._tasks.get(task_id)
+        if task is None:
             return False
 
         # Mark current task as complete
-        task.completed = True
+        self._set_completed(task, True)
         task.last_completed = datetime.now().isoformat()
 
         # If task is recurring, create a new instance
@@ -317,11 +635,69 @@ class TaskManager:
                 last_completed=None
             )
 
-            self._tasks.append(new_task)
-            self._next_id += 1
+            self._insert_task(new_task)
 
         return True
 
+    def _candidate_ids(self, status: Optional[str], priority: Optional[str], tags: Optional[List[str]]) -> Optional[Set[int]]:
+        """Return the IDs of tasks matching the status, priority, and tag criteria, or None if none of them apply."""
+        candidate_ids = None
+        want_completed = _COMPLETED_FROM_STATUS.get(status)
+        if want_completed is not None:
+            candidate_ids = self._status_index[want_completed]
+        if priority is not None:
+            priority_ids = self._priority_index.get(priority, set())
+            candidate_ids = priority_ids if candidate_ids is None else candidate_ids & priority_ids
+        if tags:
+            # Tags use OR logic - a task matches if it has ANY of the specified tags
+            tagged_ids = set().union(*(self._tag_index.get(tag, ()) for tag in tags))
+            candidate_ids = tagged_ids if candidate_ids is None else candidate_ids & tagged_ids
+        return candidate_ids
+
+    def _iter_filtered(self, status: Optional[str], priority: Optional[str], tags: Optional[List[str]], due_status: Optional[str], recurrence: Optional[str]) -> Iterator[Task]:
+        """Lazily yield the tasks matching the filter_tasks criteria, in storage order."""
+        # Narrow down by status, priority, and tags using the indexes, then test the remaining
+        # criteria on each candidate in a single pass, stopping at the first one it fails
+        candidate_ids = self._candidate_ids(status, priority, tags)
+        if candidate_ids is None:
+            tasks = self._tasks.values()
+        else:
+            # IDs are assigned in increasing order, so sorting them gives storage order
+            tasks = map(self._tasks.__getitem__, sorted(candidate_ids))
+
+        if due_status not in ("upcoming", "due-soon", "overdue"):
+            due_status = None
+        if due_status:
+            now = datetime.now()
+            soon_cutoff = now + _DUE_SOON_WINDOW
+
+        if recurrence == "all":
+            recurrence = None
+
+        for task in tasks:
+            if recurrence:
+                if recurrence == "none":
+                    if task.recurrence and task.recurrence != "none":
+                        continue
+                elif task.recurrence != recurrence:
+                    continue
+            if due_status:
+                due = task._due_dt
+                if due is None:
+                    continue
+                if due_status == "overdue":
+                    # Due in the past and not completed
+                    if not due < now or task.completed:
+                        continue
+                elif due_status == "upcoming":
+                    # Due in the future, more than 1 hour from now
+                    if not due > soon_cutoff:
+                        continue
+                elif not now < due <= soon_cutoff:
+                    # due-soon: due within the next hour
+                    continue
+            yield task
+
     def filter_tasks(self, status: Optional[str] = None, priority: Optional[str] = None, tags: Optional[List[str]] = None, due_status: Optional[str] = None, recurrence: Optional[str] = None) -> List[Task]:
         """
         Filter tasks based on status, priority, tags, due date status, and recurrence.
@@ -336,55 +712,27 @@ class TaskManager:
         Returns:
             List[Task]: List of tasks that match the filter criteria
         """
-        from datetime import datetime
-        filtered_tasks = self._tasks.copy()
+        return list(self._iter_filtered(status, priority, tags, due_status, recurrence))
 
-        # Filter by status
-        if status == "active":
-            filtered_tasks = [task for task in filtered_tasks if not task.completed]
-        elif status == "completed":
-            filtered_tasks = [task for task in filtered_tasks if task.completed]
-
-        # Filter by priority
-        if priority is not None:
-            filtered_tasks = [task for task in filtered_tasks if task.priority == priority]
-
-        # Filter by tags (OR logic - task matches if it has ANY of the specified tags)
-        if tags:
-            filtered_tasks = [task for task in filtered_tasks if any(tag in task.tags for tag in tags)]
+    def count_tasks(self, status: Optional[str] = None, priority: Optional[str] = None, tags: Optional[List[str]] = None, due_status: Optional[str] = None, recurrence: Optional[str] = None) -> int:
+        """
+        Count tasks matching the same criteria as filter_tasks without building a list.
 
-        # Filter by due date status
-        if due_status and due_status != "all":
-            now = datetime.now()
-            if due_status == "upcoming":
-                # Due in the future, more than 1 hour from now
-                filtered_tasks = [task for task in filtered_tasks
-                                  if task.due_date and
-                                  datetime.fromisoformat(task.due_date.replace('Z', '+00:00')) > now and
-                                  (datetime.fromisoformat(task.due_date.replace('Z', '+00:00')) - now).seconds > 3600]
-            elif due_status == "due-soon":
-                # Due within the next hour
-                filtered_tasks = [task for task in filtered_tasks
-                                  if task.due_date and
-                                  datetime.fromisoformat(task.due_date.replace('Z', '+00:00')) > now and
-                                  (datetime.fromisoformat(task.due_date.replace('Z', '+00:00')) - now).seconds <= 3600]
-            elif due_status == "overdue":
-                # Due in the past and not completed
-                filtered_tasks = [task for task in filtered_tasks
-                                  if task.due_date and
-                                  datetime.fromisoformat(task.due_date.replace('Z', '+00:00')) < now and
-                                  not task.completed]
-
-        # Filter by recurrence
-        if recurrence and recurrence != "all":
-            if recurrence == "none":
-                filtered_tasks = [task for task in filtered_tasks
-                                  if not task.recurrence or task.recurrence == "none"]
-            else:
-                filtered_tasks = [task for task in filtered_tasks
-                                  if task.recurrence == recurrence]
+        Args:
+            status (Optional[str]): Filter by status - "all", "active", "completed" (default: None)
+            priority (Optional[str]): Filter by priority - "high", "medium", "low" (default: None)
+            tags (Optional[List[str]]): Filter by tags - tasks with ANY of these tags (default: None)
+            due_status (Optional[str]): Filter by due date status - "all", "upcoming", "due-soon", "overdue" (default: None)
+            recurrence (Optional[str]): Filter by recurrence - "all", "none", "daily", "weekly", "monthly" (default: None)
 
-        return filtered_tasks
+        Returns:
+            int: Number of tasks that match the filter criteria
+        """
+        if not due_status and not recurrence:
+            # Only indexed criteria (if any), so the count comes straight from the indexes
+            candidate_ids = self._candidate_ids(status, priority, tags)
+            return len(self._tasks) if candidate_ids is None else len(candidate_ids)
+        return sum(1 for _ in self._iter_filtered(status, priority, tags, due_status, recurrence))
 
     def mark_incomplete(self, task_id: int) -> bool:
         """
@@ -396,11 +744,11 @@ class TaskManager:
         Returns:
             bool: True if the task was marked incomplete, False if task was not found
         """
-        task = self.get_task_by_id(task_id)
-        if task:
-            task.completed = False
-            return True
-        return False
+        task = self._tasks.get(task_id)
+        if task is None:
+            return False
+        self._set_completed(task, False)
+        return True
 
     def sort_tasks(self, sort_by: str = "created_at", reverse: bool = True) -> List[Task]:
         """
@@ -413,44 +761,40 @@ class TaskManager:
         Returns:
             List[Task]: List of tasks sorted according to the specified criteria
         """
-        from datetime import datetime
-
-        if sort_by == "created_at":
-            # Sort by creation date (newest first by default)
-            return sorted(self._tasks, key=lambda task: task.created_at, reverse=reverse)
-        elif sort_by == "priority":
-            # Define priority order for sorting: high > medium > low > None
-            priority_order = {"high": 4, "medium": 3, "low": 2, None: 1}
-            return sorted(self._tasks, key=lambda task: priority_order[task.priority], reverse=reverse)
+        tasks = self._tasks.values()
+        if sort_by == "priority":
+            # Sort by cached priority rank: high > medium > low > None
+            return sorted(tasks, key=attrgetter("_priority_ord"), reverse=reverse)
         elif sort_by == "title":
-            # Sort by title alphabetically
-            return sorted(self._tasks, key=lambda task: task.description.lower(), reverse=reverse)
+            # Sort by title alphabetically, ignoring case, using the cached casefolded description
+            return sorted(tasks, key=attrgetter("_desc_folded"), reverse=reverse)
         elif sort_by == "due_date":
             # Sort by due date (earliest first by default, None values at the end)
-            def due_date_key(task):
-                if task.due_date is None:
-                    # Return a future date so None values go to the end
-                    return datetime.max.isoformat()
-                return task.due_date
-            return sorted(self._tasks, key=lambda task: due_date_key(task), reverse=reverse)
+            return sorted(tasks, key=lambda task: task.due_date or _NO_DUE_DATE_SORT_KEY, reverse=reverse)
         elif sort_by == "due_status":
             # Sort by due date status: overdue > due soon > upcoming > no due date
-            def due_status_key(task):
-                if not task.due_date:
-                    return 0  # No due date
-                due_date = datetime.fromisoformat(task.due_date.replace('Z', '+00:00'))
-                now = datetime.now()
-
-                if due_date < now:
-                    return 3  # Overdue
-                elif (due_date - now).total_seconds() <= 3600:  # Within 1 hour
-                    return 2  # Due soon
-                else:
-                    return 1  # Upcoming
-            return sorted(self._tasks, key=lambda task: due_status_key(task), reverse=reverse)
+            now = datetime.now()
+            return sorted(tasks, key=lambda task: classify_due_date(task._due_dt, now), reverse=reverse)
         else:
-            # Default to sorting by creation date
-            return sorted(self._tasks, key=lambda task: task.created_at, reverse=reverse)
+            # Sort by creation date (newest first by default); also the fallback for unknown criteria
+            return sorted(tasks, key=attrgetter("created_at"), reverse=reverse)
+
+
+def _parse_int(text: str) -> Optional[int]:
+    """
+    Parse user input as an integer without raising on bad input.
+
+    Args:
+        text (str): The raw input string
+
+    Returns:
+        Optional[int]: The parsed value, or None if the input is not an integer
+    """
+    text = text.strip()
+    digits = text[1:] if text[:1] in ("-", "+") else text
+    if not digits.isdecimal():
+        return None
+    return int(text)
 
 
 class CLIInterface:
@@ -466,6 +810,23 @@ class CLIInterface:
             task_manager (TaskManager): The task manager to use for operations
         """
         self.task_manager = task_manager
+        self._filter_cache: Dict[tuple, List[Task]] = {}  # filter_tasks_cli results by criteria, for _filter_cache_version
+        self._filter_cache_version: int = -1
+
+    def _cached_filter_tasks(self, status: Optional[str], priority: Optional[str], tags: List[str], due_status: Optional[str], recurrence: Optional[str]) -> List[Task]:
+        """Return filter_tasks results, reusing the previous result while no task has changed."""
+        if due_status:
+            # Due date status depends on the current time, so it is never cached
+            return self.task_manager.filter_tasks(status, priority, tags or None, due_status, recurrence)
+        version = self.task_manager.version
+        if version != self._filter_cache_version:
+            self._filter_cache.clear()
+            self._filter_cache_version = version
+        key = (status, priority, tuple(sorted(tags)), recurrence)
+        tasks = self._filter_cache.get(key)
+        if tasks is None:
+            tasks = self._filter_cache[key] = self.task_manager.filter_tasks(status, priority, tags or None, None, recurrence)
+        return tasks
 
     def get_priority_indicator(self, priority: Optional[str]) -> str:
         """
@@ -477,47 +838,44 @@ class CLIInterface:
         Returns:
             str: Visual indicator for the priority
         """
-        if priority == "high":
-            return "[HIGH] High"
-        elif priority == "medium":
-            return "[MED] Medium"
-        elif priority == "low":
-            return "[LOW] Low"
-        else:
-            return "[N/A] No Priority"
+        return _PRIORITY_INDICATORS.get(priority, _NO_PRIORITY_INDICATOR)
 
-    def get_due_date_status(self, due_date: Optional[str]) -> tuple[str, str]:
+    def get_due_date_status(self, due_date: Optional[str], now: Optional[datetime] = None) -> tuple[str, str]:
         """
         Get status and color for due date.
 
         Args:
             due_date (Optional[str]): Due date in ISO format or None
+            now (Optional[datetime]): Current time to classify against (default: read the clock)
 
         Returns:
             tuple[str, str]: Status text and color indicator
         """
         if not due_date:
-            return "", ""
+            return _DUE_STATUS_DISPLAY[DUE_NONE]
 
-        from datetime import datetime
-        now = datetime.now()
-        due = datetime.fromisoformat(due_date.replace('Z', '+00:00'))
+        if now is None:
+            now = datetime.now()
+        return _DUE_STATUS_DISPLAY[classify_due_date(_parse_due_date(_normalize_iso(due_date)), now)]
 
-        if due < now:
-            return "OVERDUE", "[RED] Overdue"
-        elif (due - now).total_seconds() <= 3600:  # Within 1 hour
-            return "DUE-SOON", "[YELLOW] Due Soon"
-        else:
-            return "UPCOMING", "[GREEN] Upcoming"
+    def get_due_date_statuses(self, due_dates: List[Optional[str]], now: Optional[datetime] = None) -> List[tuple[str, str]]:
+        """
+        Get status and color for many due dates against a single clock reading.
+
+        Args:
+            due_dates (List[Optional[str]]): Due dates in ISO format or None
+            now (Optional[datetime]): Current time to classify against (default: read the clock)
+
+        Returns:
+            List[tuple[str, str]]: Status text and color indicator for each due date
+        """
+        if now is None:
+            now = datetime.now()
+        return [self.get_due_date_status(due_date, now) for due_date in due_dates]
 
     def display_recurrence_menu(self):
         """Display the recurrence selection menu to the user."""
-        print("\nSelect Recurrence:")
-        print("1. No Recurrence")
-        print("2. Daily")
-        print("3. Weekly")
-        print("4. Monthly")
-        print("5. Keep current recurrence")
+        print(_RECURRENCE_MENU)
 
     def get_recurrence_from_choice(self, choice: int, current_recurrence: Optional[str] = None) -> Optional[str]:
         """
@@ -530,27 +888,13 @@ class CLIInterface:
         Returns:
             Optional[str]: Recurrence value ("none", "daily", "weekly", "monthly", or None)
         """
-        if choice == 1:
-            return "none"
-        elif choice == 2:
-            return "daily"
-        elif choice == 3:
-            return "weekly"
-        elif choice == 4:
-            return "monthly"
-        elif choice == 5:
+        if choice == 5:
             return current_recurrence
-        else:
-            return "none"
+        return _RECURRENCE_FROM_CHOICE.get(choice, "none")
 
     def display_priority_menu(self):
         """Display the priority selection menu to the user."""
-        print("\nSelect Priority:")
-        print("1. High ([HIGH])")
-        print("2. Medium ([MED])")
-        print("3. Low ([LOW])")
-        print("4. No Priority ([N/A])")
-        print("5. Keep current priority")
+        print(_PRIORITY_MENU)
 
     def get_priority_from_choice(self, choice: int, current_priority: Optional[str] = None) -> Optional[str]:
         """
@@ -563,18 +907,9 @@ class CLIInterface:
         Returns:
             Optional[str]: Priority value ("high", "medium", "low", or None)
         """
-        if choice == 1:
-            return "high"
-        elif choice == 2:
-            return "medium"
-        elif choice == 3:
-            return "low"
-        elif choice == 4:
-            return None
-        elif choice == 5:
+        if choice == 5:
             return current_priority
-        else:
-            return None
+        return _PRIORITY_FROM_CHOICE.get(choice)
 
     def parse_tags_input(self, tags_input: str) -> List[str]:
         """
@@ -586,34 +921,112 @@ class CLIInterface:
         Returns:
             List[str]: List of individual tags
         """
-        if not tags_input.strip():
-            return []
+        # Strip each tag once, drop empty ones, and remove duplicates while preserving order
+        stripped = (tag.strip() for tag in tags_input.split(","))
+        return list(dict.fromkeys(tag for tag in stripped if tag))
+
+    def is_task_line(self, line: str) -> bool:
+        """
+        Check whether a description is a one-line task entry rather than plain text containing "|".
+
+        Args:
+            line (str): The text entered at the description prompt
+
+        Returns:
+            bool: True if any "|"-separated segment after the first is a known key=value field
+        """
+        for field_text in line.split("|")[1:]:
+            key, sep, _ = field_text.partition("=")
+            if sep and key.strip().lower() in _TASK_LINE_FIELDS:
+                return True
+        return False
+
+    def parse_task_line(self, line: str) -> dict:
+        """
+        Parse a one-line task entry such as "Pay rent | pri=high | tags=home,bills | due=2026-02-01 09:00 | rec=monthly".
+
+        Args:
+            line (str): The description followed by optional "|"-separated key=value fields
+
+        Returns:
+            dict: Keyword arguments for TaskManager.add_task
+
+        Raises:
+            ValueError: If a field is unknown, repeated, or missing "=", or the due date is not YYYY-MM-DD HH:MM
+        """
+        description, *field_texts = line.split("|")
+        task_fields = {"description": description}
+        for field_text in field_texts:
+            key, sep, value = field_text.partition("=")
+            key = key.strip().lower()
+            value = value.strip()
+            name = _TASK_LINE_FIELDS.get(key)
+            if not sep or name is None:
+                raise ValueError(f"Unknown task field '{field_text.strip()}'. Use pri=, tags=, due=, or rec=")
+            if name in task_fields:
+                raise ValueError(f"Task field '{key}' given more than once")
+
+            if name == "tags":
+                task_fields[name] = self.parse_tags_input(value)
+            elif name == "due_date":
+                try:
+                    task_fields[name] = _parse_due_input(value)
+                except ValueError:
+                    raise ValueError("Due date must be in YYYY-MM-DD HH:MM format")
+            elif name == "priority" and value.lower() == "none":
+                task_fields[name] = None
+            else:
+                task_fields[name] = value.lower()
+        return task_fields
+
+    def parse_advanced_query(self, text: str) -> Tuple[str, Optional[str], Optional[str], List[str], str, bool]:
+        """
+        Parse a one-line advanced query such as "q=report status=active pri=high tags=work,home sort=priority-desc".
 
-        tags = [tag.strip() for tag in tags_input.split(",") if tag.strip()]
-        # Remove duplicates while preserving order
-        unique_tags = []
-        for tag in tags:
-            if tag not in unique_tags:
-                unique_tags.append(tag)
-        return unique_tags
+        Args:
+            text (str): Space-separated key=value criteria; each key is optional
+
+        Returns:
+            Tuple[str, Optional[str], Optional[str], List[str], str, bool]: Search query, status filter,
+            priority filter, tags filter, sort field, and reverse flag
+
+        Raises:
+            ValueError: If a criterion is unknown, repeated, or has an invalid value
+        """
+        leftover = _ADVANCED_QUERY_RE.sub("", text).strip()
+        if leftover:
+            raise ValueError(f"Unknown query criterion '{leftover.split()[0]}'. Use q=, status=, pri=, tags=, or sort=")
+
+        criteria = {}
+        for key, value in _ADVANCED_QUERY_RE.findall(text):
+            if key in criteria:
+                raise ValueError(f"Query criterion '{key}' given more than once")
+            criteria[key] = value
+
+        status = criteria.get("status", "all").lower()
+        if status not in ("all", "active", "completed"):
+            raise ValueError("Status must be one of: 'all', 'active', 'completed'")
+        priority = criteria.get("pri", "all").lower()
+        if priority != "all" and priority not in _ALLOWED_PRIORITIES:
+            raise ValueError("Priority must be one of: 'all', 'high', 'medium', 'low'")
+
+        sort_by, _, direction = criteria.get("sort", "created_at").lower().partition("-")
+        if sort_by not in _ADVANCED_SORT_FIELDS or direction not in ("", "asc", "desc"):
+            raise ValueError(f"Sort must be one of: {', '.join(_ADVANCED_SORT_FIELDS)}, optionally followed by -asc or -desc")
+        reverse = direction == "desc" if direction else _ADVANCED_SORT_FIELDS[sort_by]
+
+        return (
+            criteria.get("q", ""),
+            None if status == "all" else status,
+            None if priority == "all" else priority,
+            self.parse_tags_input(criteria.get("tags", "")),
+            sort_by,
+            reverse,
+        )
 
     def display_menu(self):
         """Display the main menu options to the user."""
-        print("\n" + "="*40)
-        print("Todo Application - Main Menu")
-        print("="*40)
-        print("1. Add Task")
-        print("2. View Task List")
-        print("3. Update Task")
-        print("4. Delete Task")
-        print("5. Mark Task Complete")
-        print("6. Mark Task Incomplete")
-        print("7. Search Tasks")
-        print("8. Filter Tasks")
-        print("9. Sort Tasks")
-        print("10. Advanced Search/Filter/Sort")
-        print("11. Exit")
-        print("="*40)
+        print(_MENU)
 
     def get_user_choice(self) -> int:
         """
@@ -623,28 +1036,33 @@ class CLIInterface:
             int: The valid menu selection (1-11)
         """
         while True:
-            try:
-                choice = int(input("Enter your choice (1-11): "))
-                if 1 <= choice <= 11:
-                    return choice
-                else:
-                    print("Invalid choice. Please enter a number between 1 and 11.")
-            except ValueError:
+            choice = _parse_int(input("Enter your choice (1-11): "))
+            if choice is None:
                 print("Invalid input. Please enter a number between 1 and 11.")
+            elif 1 <= choice <= 11:
+                return choice
+            else:
+                print("Invalid choice. Please enter a number between 1 and 11.")
 
     def add_task_cli(self):
         """Handle adding tasks through the CLI."""
         try:
             description = input("Enter task description: ")
 
+            # A "|"-separated line with task fields carries everything at once, so skip the remaining prompts
+            if "|" in description and self.is_task_line(description):
+                task = self.task_manager.add_task(**self.parse_task_line(description))
+                print(f"Task added successfully with ID {task.id}.")
+                return
+
             # Get priority
             self.display_priority_menu()
-            try:
-                priority_choice = int(input("Enter your choice (1-5): "))
-                priority = self.get_priority_from_choice(priority_choice)
-            except ValueError:
+            priority_choice = _parse_int(input("Enter your choice (1-5): "))
+            if priority_choice is None:
                 print("Invalid choice. Setting priority to None.")
                 priority = None
+            else:
+                priority = self.get_priority_from_choice(priority_choice)
 
             # Get tags
             tags_input = input("Enter tags (comma-separated, or press Enter for none): ")
@@ -656,20 +1074,19 @@ class CLIInterface:
             if due_date_input.strip():
                 try:
                     # Parse the date - expecting format like "2026-01-01 14:30"
-                    from datetime import datetime
-                    due_date = datetime.strptime(due_date_input, "%Y-%m-%d %H:%M").isoformat()
+                    due_date = _parse_due_input(due_date_input)
                 except ValueError:
                     print("Invalid date format. Due date not set.")
                     due_date = None
 
             # Get recurrence
             self.display_recurrence_menu()
-            try:
-                recurrence_choice = int(input("Enter your choice (1-5): "))
-                recurrence = self.get_recurrence_from_choice(recurrence_choice)
-            except ValueError:
+            recurrence_choice = _parse_int(input("Enter your choice (1-5): "))
+            if recurrence_choice is None:
                 print("Invalid choice. Setting recurrence to 'none'.")
                 recurrence = "none"
+            else:
+                recurrence = self.get_recurrence_from_choice(recurrence_choice)
 
             task = self.task_manager.add_task(
                 description,
@@ -684,41 +1101,55 @@ class CLIInterface:
 
     def view_task_list_cli(self):
         """Display all tasks in the console."""
-        tasks = self.task_manager.get_all_tasks()
-
-        if not tasks:
+        if not self.task_manager.count_tasks():
             print("\nYour task list is empty.")
             return
 
-        print("\nYour Tasks:")
-        print("-" * 100)
-        for task in tasks:
-            status = "[x]" if task.completed else "[ ]"
+        # Build the whole listing and write it in one call rather than three prints per task
+        now = datetime.now()
+        lines = ["\nYour Tasks:", _SEP_WIDE]
+        for task in self.task_manager.iter_tasks():
+            status = _STATUS[task.completed]
             priority_indicator = self.get_priority_indicator(task.priority)
             tags_str = ", ".join(task.tags) if task.tags else "No tags"
 
             # Get due date status
-            due_status, due_indicator = self.get_due_date_status(task.due_date)
+            due_status, due_indicator = _DUE_STATUS_DISPLAY[classify_due_date(task._due_dt, now)]
             due_date_str = task.due_date if task.due_date else "No due date"
             recurrence_str = task.recurrence if task.recurrence else "none"
 
-            print(f"ID: {task.id} | {status} {task.description}")
-            print(f"      Priority: {priority_indicator} | Due: {due_date_str} {due_indicator}")
-            print(f"      Recurrence: {recurrence_str} | Tags: {tags_str}")
-        print("-" * 100)
+            lines.append(f"ID: {task.id} | {status} {task.description}")
+            lines.append(f"      Priority: {priority_indicator} | Due: {due_date_str} {due_indicator}")
+            lines.append(f"      Recurrence: {recurrence_str} | Tags: {tags_str}")
+        lines.append(_SEP_WIDE)
+        sys.stdout.write("\n".join(lines) + "\n")
 
-    def update_task_cli(self):
-        """Handle updating task descriptions through the CLI."""
-        try:
-            task_id = int(input("Enter task ID to update: "))
-        except ValueError:
+    def _prompt_existing_task(self, action: str) -> Optional[Task]:
+        """
+        Ask for a task ID and look the task up, reporting bad or unknown IDs.
+
+        Args:
+            action (str): What the task is wanted for, used in the prompt (e.g. "delete")
+
+        Returns:
+            Task or None: The selected task, or None if the input was invalid or no task has that ID
+        """
+        task_id = _parse_int(input(f"Enter task ID to {action}: "))
+        if task_id is None:
             print("Invalid task ID. Please enter a number.")
-            return
+            return None
 
         task = self.task_manager.get_task_by_id(task_id)
-        if not task:
+        if task is None:
             print(f"Task with ID {task_id} not found.")
+        return task
+
+    def update_task_cli(self):
+        """Handle updating task descriptions through the CLI."""
+        task = self._prompt_existing_task("update")
+        if task is None:
             return
+        task_id = task.id
 
         try:
             # Ask what to update
@@ -728,23 +1159,23 @@ class CLIInterface:
             print(f"Current due date: {task.due_date if task.due_date else 'No due date'}")
             print(f"Current recurrence: {task.recurrence if task.recurrence else 'none'}")
 
-            update_desc = input("Update description? (y/n, or press Enter for no): ").lower() in ['y', 'yes', '']
+            update_desc = input("Update description? (y/n, or press Enter for no): ").strip().lower() in _YES_OR_EMPTY
             new_description = None
             if update_desc:
                 new_description = input(f"Enter new description (current: '{task.description}'): ")
 
-            update_priority = input("Update priority? (y/n, or press Enter for no): ").lower() in ['y', 'yes', '']
+            update_priority = input("Update priority? (y/n, or press Enter for no): ").strip().lower() in _YES_OR_EMPTY
             new_priority = None
             if update_priority:
                 self.display_priority_menu()
-                try:
-                    priority_choice = int(input("Enter your choice (1-5): "))
-                    new_priority = self.get_priority_from_choice(priority_choice, task.priority)
-                except ValueError:
+                priority_choice = _parse_int(input("Enter your choice (1-5): "))
+                if priority_choice is None:
                     print("Invalid choice. Keeping current priority.")
                     new_priority = task.priority
+                else:
+                    new_priority = self.get_priority_from_choice(priority_choice, task.priority)
 
-            update_tags = input("Update tags? (y/n, or press Enter for no): ").lower() in ['y', 'yes', '']
+            update_tags = input("Update tags? (y/n, or press Enter for no): ").strip().lower() in _YES_OR_EMPTY
             new_tags = None
             if update_tags:
                 tags_input = input(f"Enter new tags (comma-separated, or press Enter to keep current: '{', '.join(task.tags) if task.tags else 'None'}'): ")
@@ -753,31 +1184,30 @@ class CLIInterface:
                 else:
                     new_tags = task.tags  # Keep current tags if input is empty
 
-            update_due_date = input("Update due date? (y/n, or press Enter for no): ").lower() in ['y', 'yes', '']
+            update_due_date = input("Update due date? (y/n, or press Enter for no): ").strip().lower() in _YES_OR_EMPTY
             new_due_date = None
             if update_due_date:
                 due_date_input = input(f"Enter new due date (YYYY-MM-DD HH:MM, or press Enter to keep current: '{task.due_date or 'None'}'): ")
                 if due_date_input.strip():
                     try:
                         # Parse the date - expecting format like "2026-01-01 14:30"
-                        from datetime import datetime
-                        new_due_date = datetime.strptime(due_date_input, "%Y-%m-%d %H:%M").isoformat()
+                        new_due_date = _parse_due_input(due_date_input)
                     except ValueError:
                         print("Invalid date format. Keeping current due date.")
                         new_due_date = task.due_date
                 else:
                     new_due_date = task.due_date  # Keep current due date if input is empty
 
-            update_recurrence = input("Update recurrence? (y/n, or press Enter for no): ").lower() in ['y', 'yes', '']
+            update_recurrence = input("Update recurrence? (y/n, or press Enter for no): ").strip().lower() in _YES_OR_EMPTY
             new_recurrence = None
             if update_recurrence:
                 self.display_recurrence_menu()
-                try:
-                    recurrence_choice = int(input("Enter your choice (1-5): "))
-                    new_recurrence = self.get_recurrence_from_choice(recurrence_choice, task.recurrence)
-                except ValueError:
+                recurrence_choice = _parse_int(input("Enter your choice (1-5): "))
+                if recurrence_choice is None:
                     print("Invalid choice. Keeping current recurrence.")
                     new_recurrence = task.recurrence
+                else:
+                    new_recurrence = self.get_recurrence_from_choice(recurrence_choice, task.recurrence)
 
             updated = self.task_manager.update_task(
                 task_id,
@@ -796,19 +1226,13 @@ class CLIInterface:
 
     def delete_task_cli(self):
         """Handle deleting tasks through the CLI."""
-        try:
-            task_id = int(input("Enter task ID to delete: "))
-        except ValueError:
-            print("Invalid task ID. Please enter a number.")
-            return
-
-        task = self.task_manager.get_task_by_id(task_id)
-        if not task:
-            print(f"Task with ID {task_id} not found.")
+        task = self._prompt_existing_task("delete")
+        if task is None:
             return
+        task_id = task.id
 
         confirm = input(f"Are you sure you want to delete task '{task.description}'? (y/n): ")
-        if confirm.lower() in ['y', 'yes']:
+        if confirm.strip().lower() in _YES:
             deleted = self.task_manager.delete_task(task_id)
             if deleted:
                 print(f"Task {task_id} deleted successfully.")
@@ -832,26 +1256,19 @@ class CLIInterface:
             print(f"\nNo tasks found matching '{query}'.")
             return
 
-        print(f"\nSearch results for '{query}':")
-        print("-" * 80)
+        lines = [f"\nSearch results for '{query}':", _SEP_NARROW]
         for task in matching_tasks:
-            status = "[x]" if task.completed else "[ ]"
+            status = _STATUS[task.completed]
             priority_indicator = self.get_priority_indicator(task.priority)
             tags_str = ", ".join(task.tags) if task.tags else "No tags"
-            print(f"ID: {task.id} | {status} {task.description}")
-            print(f"      Priority: {priority_indicator} | Tags: {tags_str}")
-        print("-" * 80)
+            lines.append(f"ID: {task.id} | {status} {task.description}")
+            lines.append(f"      Priority: {priority_indicator} | Tags: {tags_str}")
+        lines.append(_SEP_NARROW)
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def display_filter_menu(self):
         """Display the filter options menu to the user."""
-        print("\nFilter Options:")
-        print("1. Filter by Status")
-        print("2. Filter by Priority")
-        print("3. Filter by Tags")
-        print("4. Filter by Due Date Status")
-        print("5. Filter by Recurrence")
-        print("6. Clear all filters")
-        print("7. Back to main menu")
+        print(_FILTER_MENU)
 
     def filter_tasks_cli(self):
         """Handle filtering tasks through the CLI."""
@@ -860,14 +1277,15 @@ class CLIInterface:
         tags_filter = []
         due_status_filter = None
         recurrence_filter = None
+        criteria = "Status: All, Priority: All, Tags: All, Due Status: All, Recurrence: All"
+        banner = f"\nCurrent filters - {criteria}"  # Re-rendered only when a filter may have changed
 
         while True:
-            print(f"\nCurrent filters - Status: {status_filter or 'All'}, Priority: {priority_filter or 'All'}, Tags: {', '.join(tags_filter) or 'All'}, Due Status: {due_status_filter or 'All'}, Recurrence: {recurrence_filter or 'All'}")
+            print(banner)
             self.display_filter_menu()
 
-            try:
-                choice = int(input("Enter your choice (1-7): "))
-            except ValueError:
+            choice = _parse_int(input("Enter your choice (1-7): "))
+            if choice is None:
                 print("Invalid input. Please enter a number between 1 and 7.")
                 continue
 
@@ -877,28 +1295,22 @@ class CLIInterface:
                 print("1. All")
                 print("2. Active only")
                 print("3. Completed only")
-                try:
-                    status_choice = int(input("Enter your choice (1-3): "))
-                    if status_choice == 1:
-                        status_filter = None
-                    elif status_choice == 2:
-                        status_filter = "active"
-                    elif status_choice == 3:
-                        status_filter = "completed"
-                    else:
-                        print("Invalid choice. No status filter applied.")
-                except ValueError:
+                status_choice = _parse_int(input("Enter your choice (1-3): "))
+                if status_choice is None:
                     print("Invalid input. No status filter applied.")
+                elif status_choice in _STATUS_FILTER_FROM_CHOICE:
+                    status_filter = _STATUS_FILTER_FROM_CHOICE[status_choice]
+                else:
+                    print("Invalid choice. No status filter applied.")
 
             elif choice == 2:
                 # Filter by priority
                 self.display_priority_menu()
-                try:
-                    priority_choice = int(input("Enter your choice (1-4): "))
-                    priority = self.get_priority_from_choice(priority_choice)
-                    priority_filter = priority
-                except ValueError:
+                priority_choice = _parse_int(input("Enter your choice (1-4): "))
+                if priority_choice is None:
                     print("Invalid input. No priority filter applied.")
+                else:
+                    priority_filter = self.get_priority_from_choice(priority_choice)
 
             elif choice == 3:
                 # Filter by tags
@@ -914,20 +1326,13 @@ class CLIInterface:
                 print("2. Upcoming")
                 print("3. Due Soon")
                 print("4. Overdue")
-                try:
-                    due_status_choice = int(input("Enter your choice (1-4): "))
-                    if due_status_choice == 1:
-                        due_status_filter = None
-                    elif due_status_choice == 2:
-                        due_status_filter = "upcoming"
-                    elif due_status_choice == 3:
-                        due_status_filter = "due-soon"
-                    elif due_status_choice == 4:
-                        due_status_filter = "overdue"
-                    else:
-                        print("Invalid choice. No due date status filter applied.")
-                except ValueError:
+                due_status_choice = _parse_int(input("Enter your choice (1-4): "))
+                if due_status_choice is None:
                     print("Invalid input. No due date status filter applied.")
+                elif due_status_choice in _DUE_STATUS_FILTER_FROM_CHOICE:
+                    due_status_filter = _DUE_STATUS_FILTER_FROM_CHOICE[due_status_choice]
+                else:
+                    print("Invalid choice. No due date status filter applied.")
 
             elif choice == 5:
                 # Filter by recurrence
@@ -937,22 +1342,13 @@ class CLIInterface:
                 print("3. Daily")
                 print("4. Weekly")
                 print("5. Monthly")
-                try:
-                    recurrence_choice = int(input("Enter your choice (1-5): "))
-                    if recurrence_choice == 1:
-                        recurrence_filter = None
-                    elif recurrence_choice == 2:
-                        recurrence_filter = "none"
-                    elif recurrence_choice == 3:
-                        recurrence_filter = "daily"
-                    elif recurrence_choice == 4:
-                        recurrence_filter = "weekly"
-                    elif recurrence_choice == 5:
-                        recurrence_filter = "monthly"
-                    else:
-                        print("Invalid choice. No recurrence filter applied.")
-                except ValueError:
+                recurrence_choice = _parse_int(input("Enter your choice (1-5): "))
+                if recurrence_choice is None:
                     print("Invalid input. No recurrence filter applied.")
+                elif recurrence_choice in _RECURRENCE_FILTER_FROM_CHOICE:
+                    recurrence_filter = _RECURRENCE_FILTER_FROM_CHOICE[recurrence_choice]
+                else:
+                    print("Invalid choice. No recurrence filter applied.")
 
             elif choice == 6:
                 # Clear all filters
@@ -972,64 +1368,53 @@ class CLIInterface:
 
             # Show filtered results after each filter change
             if choice in [1, 2, 3, 4, 5, 6]:
-                filtered_tasks = self.task_manager.filter_tasks(
-                    status=status_filter,
-                    priority=priority_filter,
-                    tags=tags_filter if tags_filter else None,
-                    due_status=due_status_filter,
-                    recurrence=recurrence_filter
-                )
+                criteria = f"Status: {status_filter or 'All'}, Priority: {priority_filter or 'All'}, Tags: {', '.join(tags_filter) or 'All'}, Due Status: {due_status_filter or 'All'}, Recurrence: {recurrence_filter or 'All'}"
+                banner = f"\nCurrent filters - {criteria}"
+                filtered_tasks = self._cached_filter_tasks(status_filter, priority_filter, tags_filter, due_status_filter, recurrence_filter)
 
                 if not filtered_tasks:
-                    print(f"\nNo tasks match current filters (Status: {status_filter or 'All'}, Priority: {priority_filter or 'All'}, Tags: {', '.join(tags_filter) or 'All'}, Due Status: {due_status_filter or 'All'}, Recurrence: {recurrence_filter or 'All'}).")
+                    print(f"\nNo tasks match current filters ({criteria}).")
                 else:
-                    print(f"\nFiltered tasks (Status: {status_filter or 'All'}, Priority: {priority_filter or 'All'}, Tags: {', '.join(tags_filter) or 'All'}, Due Status: {due_status_filter or 'All'}, Recurrence: {recurrence_filter or 'All'}):")
-                    print("-" * 100)
+                    print(f"\nFiltered tasks ({criteria}):")
+                    now = datetime.now()
+                    lines = [_SEP_WIDE]
                     for task in filtered_tasks:
-                        status = "[x]" if task.completed else "[ ]"
+                        status = _STATUS[task.completed]
                         priority_indicator = self.get_priority_indicator(task.priority)
                         tags_str = ", ".join(task.tags) if task.tags else "No tags"
-                        due_status, due_indicator = self.get_due_date_status(task.due_date)
+                        due_status, due_indicator = _DUE_STATUS_DISPLAY[classify_due_date(task._due_dt, now)]
                         due_date_str = task.due_date if task.due_date else "No due date"
                         recurrence_str = task.recurrence if task.recurrence else "none"
 
-                        print(f"ID: {task.id} | {status} {task.description}")
-                        print(f"      Priority: {priority_indicator} | Due: {due_date_str} {due_indicator}")
-                        print(f"      Recurrence: {recurrence_str} | Tags: {tags_str}")
-                    print("-" * 100)
+                        lines.append(f"ID: {task.id} | {status} {task.description}")
+                        lines.append(f"      Priority: {priority_indicator} | Due: {due_date_str} {due_indicator}")
+                        lines.append(f"      Recurrence: {recurrence_str} | Tags: {tags_str}")
+                    lines.append(_SEP_WIDE)
+                    sys.stdout.write("\n".join(lines) + "\n")
 
     def display_sort_menu(self):
         """Display the sort options menu to the user."""
-        print("\nSort Options:")
-        print("1. Sort by Creation Date (Newest first)")
-        print("2. Sort by Creation Date (Oldest first)")
-        print("3. Sort by Priority (High to Low)")
-        print("4. Sort by Priority (Low to High)")
-        print("5. Sort by Title (A-Z)")
-        print("6. Sort by Title (Z-A)")
-        print("7. Sort by Due Date (Earliest first)")
-        print("8. Sort by Due Date (Latest first)")
-        print("9. Sort by Due Status (Overdue first)")
+        print(_SORT_MENU)
 
     def display_advanced_menu(self):
         """Display the advanced options menu to the user."""
-        print("\nAdvanced Options:")
-        print("1. Search + Filter + Sort")
-        print("2. Search + Filter")
-        print("3. Search + Sort")
-        print("4. Filter + Sort")
-        print("5. Back to main menu")
+        print(_ADVANCED_MENU)
 
     def advanced_tasks_cli(self):
         """Handle advanced search/filter/sort operations through the CLI."""
         while True:
             self.display_advanced_menu()
 
-            try:
-                choice = int(input("Enter your choice (1-5): "))
-            except ValueError:
-                print("Invalid input. Please enter a number between 1 and 5.")
-                continue
+            choice_input = input("Enter your choice (1-5, or a query like 'q=report status=active sort=priority-desc'): ")
+            # All criteria given on one line, so none of the prompts below are needed
+            one_line_query = "=" in choice_input
+            if one_line_query:
+                choice = None
+            else:
+                choice = _parse_int(choice_input)
+                if choice is None:
+                    print("Invalid input. Please enter a number between 1 and 5.")
+                    continue
 
             if choice == 5:
                 # Back to main menu
@@ -1043,6 +1428,13 @@ class CLIInterface:
             sort_by = "created_at"
             reverse = True
 
+            if one_line_query:
+                try:
+                    query, status_filter, priority_filter, tags_filter, sort_by, reverse = self.parse_advanced_query(choice_input)
+                except ValueError as e:
+                    print(f"Error: {e}")
+                    continue
+
             # Get search query if needed
             if choice in [1, 2, 3]:  # Search is involved
                 query = input("Enter search query (or press Enter for none): ")
@@ -1054,28 +1446,24 @@ class CLIInterface:
                 print("1. All")
                 print("2. Active only")
                 print("3. Completed only")
-                try:
-                    status_input = input("Enter your choice (1-3, or press Enter for all): ")
-                    if status_input:
-                        status_choice = int(status_input)
-                        if status_choice == 2:
-                            status_filter = "active"
-                        elif status_choice == 3:
-                            status_filter = "completed"
-                except ValueError:
-                    print("Invalid input. Using 'All' status filter.")
+                status_input = input("Enter your choice (1-3, or press Enter for all): ")
+                if status_input:
+                    status_choice = _parse_int(status_input)
+                    if status_choice is None:
+                        print("Invalid input. Using 'All' status filter.")
+                    else:
+                        status_filter = _STATUS_FILTER_FROM_CHOICE.get(status_choice)
 
                 # Get priority filter
                 print("\nCurrent priority options:")
                 self.display_priority_menu()
-                try:
-                    priority_input = input("Enter your choice (1-4, or press Enter for all): ")
-                    if priority_input:
-                        priority_choice = int(priority_input)
-                        priority = self.get_priority_from_choice(priority_choice)
-                        priority_filter = priority
-                except ValueError:
-                    print("Invalid input. Using 'All' priority filter.")
+                priority_input = input("Enter your choice (1-4, or press Enter for all): ")
+                if priority_input:
+                    priority_choice = _parse_int(priority_input)
+                    if priority_choice is None:
+                        print("Invalid input. Using 'All' priority filter.")
+                    else:
+                        priority_filter = self.get_priority_from_choice(priority_choice)
 
                 # Get tags filter
                 tags_input = input("Enter tags to filter by (comma-separated, or press Enter for all): ")
@@ -1085,172 +1473,80 @@ class CLIInterface:
             # Get sort option if needed
             if choice in [1, 3, 4]:  # Sort is involved
                 self.display_sort_menu()
-                try:
-                    sort_input = input("Enter your choice (1-9, or press Enter for default): ")
-                    if sort_input:
-                        sort_choice = int(sort_input)
-                        if sort_choice == 1:
-                            sort_by = "created_at"
-                            reverse = True
-                        elif sort_choice == 2:
-                            sort_by = "created_at"
-                            reverse = False
-                        elif sort_choice == 3:
-                            sort_by = "priority"
-                            reverse = True
-                        elif sort_choice == 4:
-                            sort_by = "priority"
-                            reverse = False
-                        elif sort_choice == 5:
-                            sort_by = "title"
-                            reverse = False
-                        elif sort_choice == 6:
-                            sort_by = "title"
-                            reverse = True
-                        elif sort_choice == 7:
-                            sort_by = "due_date"
-                            reverse = False
-                        elif sort_choice == 8:
-                            sort_by = "due_date"
-                            reverse = True
-                        elif sort_choice == 9:
-                            sort_by = "due_status"
-                            reverse = True
-                        else:
-                            print("Invalid choice. Using default sort.")
-                except ValueError:
-                    print("Invalid input. Using default sort.")
-
-            # Apply operations in order: search -> filter -> sort
-            # Start with all tasks
-            tasks = self.task_manager.get_all_tasks()
-
-            # Apply search if query exists
-            if query.strip():
-                tasks = self.task_manager.search_tasks(query)
-
-            # Apply filter if any filter is set
-            if status_filter is not None or priority_filter is not None or tags_filter:
-                # Create a temporary TaskManager-like object to use the filter method
-                # We'll create a temporary list and apply filters
-                filtered_tasks = []
-                for task in tasks:
-                    # Apply status filter
-                    if status_filter == "active" and task.completed:
-                        continue
-                    if status_filter == "completed" and not task.completed:
-                        continue
-
-                    # Apply priority filter
-                    if priority_filter is not None and task.priority != priority_filter:
-                        continue
-
-                    # Apply tags filter (OR logic within tags)
-                    if tags_filter and not any(tag in task.tags for tag in tags_filter):
-                        continue
-
-                    filtered_tasks.append(task)
-                tasks = filtered_tasks
+                sort_input = input("Enter your choice (1-9, or press Enter for default): ")
+                if sort_input:
+                    sort_choice = _parse_int(sort_input)
+                    if sort_choice is None:
+                        print("Invalid input. Using default sort.")
+                    elif sort_choice in _SORT_FROM_CHOICE:
+                        sort_by, reverse = _SORT_FROM_CHOICE[sort_choice]
+                    else:
+                        print("Invalid choice. Using default sort.")
+
+            # Apply search and filters in a single pass, then sort
+            query_folded = query.casefold().strip()
+            want_completed = _COMPLETED_FROM_STATUS.get(status_filter)
+            tags_set = set(tags_filter)
+            if query_folded or want_completed is not None or priority_filter is not None or tags_set:
+                tasks = [
+                    task for task in self.task_manager.get_all_tasks()
+                    if (not query_folded or query_folded in task._desc_folded)
+                    and (want_completed is None or task.completed == want_completed)
+                    and (priority_filter is None or task.priority == priority_filter)
+                    # Tags use OR logic - a task matches if it has ANY of the specified tags
+                    and (not tags_set or not tags_set.isdisjoint(task.tags))
+                ]
+            else:
+                # No search or filter criteria, so every task is kept without testing each one
+                tasks = list(self.task_manager.get_all_tasks())
 
-            # Apply sort
+            # Apply sort in place; tasks is a fresh list built above
             if sort_by == "created_at":
-                tasks = sorted(tasks, key=lambda task: task.created_at, reverse=reverse)
+                tasks.sort(key=attrgetter("created_at"), reverse=reverse)
             elif sort_by == "priority":
-                priority_order = {"high": 4, "medium": 3, "low": 2, None: 1}
-                tasks = sorted(tasks, key=lambda task: priority_order[task.priority], reverse=reverse)
+                tasks.sort(key=attrgetter("_priority_ord"), reverse=reverse)
             elif sort_by == "title":
-                tasks = sorted(tasks, key=lambda task: task.description.lower(), reverse=reverse)
+                tasks.sort(key=attrgetter("_desc_folded"), reverse=reverse)
             elif sort_by == "due_date":
-                def due_date_key(task):
-                    if task.due_date is None:
-                        # Return a future date so None values go to the end
-                        from datetime import datetime
-                        return datetime.max.isoformat()
-                    return task.due_date
-                tasks = sorted(tasks, key=lambda task: due_date_key(task), reverse=reverse)
+                tasks.sort(key=lambda task: task.due_date or _NO_DUE_DATE_SORT_KEY, reverse=reverse)
             elif sort_by == "due_status":
-                def due_status_key(task):
-                    if not task.due_date:
-                        return 0  # No due date
-                    from datetime import datetime
-                    due_date = datetime.fromisoformat(task.due_date.replace('Z', '+00:00'))
-                    now = datetime.now()
-
-                    if due_date < now:
-                        return 3  # Overdue
-                    elif (due_date - now).total_seconds() <= 3600:  # Within 1 hour
-                        return 2  # Due soon
-                    else:
-                        return 1  # Upcoming
-                tasks = sorted(tasks, key=lambda task: due_status_key(task), reverse=reverse)
-
-            # Display results
-            if not tasks:
-                print(f"\nNo tasks match your criteria.")
-                if query:
-                    print(f"  Search query: {query}")
-                print(f"  Status: {status_filter or 'All'}")
-                print(f"  Priority: {priority_filter or 'All'}")
-                print(f"  Tags: {', '.join(tags_filter) or 'All'}")
-                print(f"  Sort by: {sort_by}, {'descending' if reverse else 'ascending'}")
-            else:
-                print(f"\nFiltered and sorted tasks:")
-                if query:
-                    print(f"  Search query: {query}")
-                print(f"  Status: {status_filter or 'All'}")
-                print(f"  Priority: {priority_filter or 'All'}")
-                print(f"  Tags: {', '.join(tags_filter) or 'All'}")
-                print(f"  Sort by: {sort_by}, {'descending' if reverse else 'ascending'}")
-                print("-" * 80)
+                # Overdue > due soon > upcoming > no due date, from each task's cached due date
+                now = datetime.now()
+                tasks.sort(key=lambda task: classify_due_date(task._due_dt, now), reverse=reverse)
+
+            # Display results, with the criteria summary, in a single write
+            lines = ["\nFiltered and sorted tasks:" if tasks else "\nNo tasks match your criteria."]
+            if query:
+                lines.append(f"  Search query: {query}")
+            lines.append(f"  Status: {status_filter or 'All'}")
+            lines.append(f"  Priority: {priority_filter or 'All'}")
+            lines.append(f"  Tags: {', '.join(tags_filter) or 'All'}")
+            lines.append(f"  Sort by: {sort_by}, {'descending' if reverse else 'ascending'}")
+            if tasks:
+                lines.append(_SEP_NARROW)
                 for task in tasks:
-                    status = "[x]" if task.completed else "[ ]"
+                    status = _STATUS[task.completed]
                     priority_indicator = self.get_priority_indicator(task.priority)
                     tags_str = ", ".join(task.tags) if task.tags else "No tags"
-                    print(f"ID: {task.id} | {status} {task.description}")
-                    print(f"      Priority: {priority_indicator} | Tags: {tags_str}")
-                print("-" * 80)
+                    lines.append(f"ID: {task.id} | {status} {task.description}")
+                    lines.append(f"      Priority: {priority_indicator} | Tags: {tags_str}")
+                lines.append(_SEP_NARROW)
+            sys.stdout.write("\n".join(lines) + "\n")
 
     def sort_tasks_cli(self):
         """Handle sorting tasks through the CLI."""
         self.display_sort_menu()
 
-        try:
-            choice = int(input("Enter your choice (1-6): "))
-        except ValueError:
-            print("Invalid input. Please enter a number between 1 and 6.")
+        choice = _parse_int(input("Enter your choice (1-9): "))
+        if choice is None:
+            print("Invalid input. Please enter a number between 1 and 9.")
             return
 
-        sort_by = "created_at"
-        reverse = True  # Default to descending
-
-        if choice == 1:
-            # Sort by creation date (newest first) - default behavior
-            sort_by = "created_at"
-            reverse = True
-        elif choice == 2:
-            # Sort by creation date (oldest first)
-            sort_by = "created_at"
-            reverse = False
-        elif choice == 3:
-            # Sort by priority (high to low)
-            sort_by = "priority"
-            reverse = True
-        elif choice == 4:
-            # Sort by priority (low to high)
-            sort_by = "priority"
-            reverse = False
-        elif choice == 5:
-            # Sort by title (A-Z)
-            sort_by = "title"
-            reverse = False
-        elif choice == 6:
-            # Sort by title (Z-A)
-            sort_by = "title"
-            reverse = True
+        if choice in _SORT_FROM_CHOICE:
+            sort_by, reverse = _SORT_FROM_CHOICE[choice]
         else:
             print("Invalid choice. Using default sort (newest first).")
-            sort_by = "created_at"
-            reverse = True
+            sort_by, reverse = _SORT_FROM_CHOICE[1]
 
         sorted_tasks = self.task_manager.sort_tasks(sort_by=sort_by, reverse=reverse)
 
@@ -1258,28 +1554,22 @@ class CLIInterface:
             print("\nNo tasks to display.")
             return
 
-        print(f"\nSorted tasks (by {sort_by}, {'descending' if reverse else 'ascending'}):")
-        print("-" * 80)
+        lines = [f"\nSorted tasks (by {sort_by}, {'descending' if reverse else 'ascending'}):", _SEP_NARROW]
         for task in sorted_tasks:
-            status = "[x]" if task.completed else "[ ]"
+            status = _STATUS[task.completed]
             priority_indicator = self.get_priority_indicator(task.priority)
             tags_str = ", ".join(task.tags) if task.tags else "No tags"
-            print(f"ID: {task.id} | {status} {task.description}")
-            print(f"      Priority: {priority_indicator} | Tags: {tags_str}")
-        print("-" * 80)
+            lines.append(f"ID: {task.id} | {status} {task.description}")
+            lines.append(f"      Priority: {priority_indicator} | Tags: {tags_str}")
+        lines.append(_SEP_NARROW)
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def mark_task_complete_cli(self):
         """Handle marking tasks as complete through the CLI."""
-        try:
-            task_id = int(input("Enter task ID to mark complete: "))
-        except ValueError:
-            print("Invalid task ID. Please enter a number.")
-            return
-
-        task = self.task_manager.get_task_by_id(task_id)
-        if not task:
-            print(f"Task with ID {task_id} not found.")
+        task = self._prompt_existing_task("mark complete")
+        if task is None:
             return
+        task_id = task.id
 
         marked = self.task_manager.mark_complete(task_id)
         if marked:
@@ -1289,16 +1579,10 @@ class CLIInterface:
 
     def mark_task_incomplete_cli(self):
         """Handle marking tasks as incomplete through the CLI."""
-        try:
-            task_id = int(input("Enter task ID to mark incomplete: "))
-        except ValueError:
-            print("Invalid task ID. Please enter a number.")
-            return
-
-        task = self.task_manager.get_task_by_id(task_id)
-        if not task:
-            print(f"Task with ID {task_id} not found.")
+        task = self._prompt_existing_task("mark incomplete")
+        if task is None:
             return
+        task_id = task.id
 
         marked = self.task_manager.mark_incomplete(task_id)
         if marked:
@@ -1309,38 +1593,37 @@ class CLIInterface:
 
 def main():
     """Main application entry point."""
+    # Don't flush on every newline; input() flushes pending output before each prompt
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False)
+
     print("Welcome to the Todo App!")
 
     task_manager = TaskManager()
     cli_interface = CLIInterface(task_manager)
 
+    # Menu choice -> handler; get_user_choice only returns 1-11 and 11 exits
+    actions = {
+        1: cli_interface.add_task_cli,
+        2: cli_interface.view_task_list_cli,
+        3: cli_interface.update_task_cli,
+        4: cli_interface.delete_task_cli,
+        5: cli_interface.mark_task_complete_cli,
+        6: cli_interface.mark_task_incomplete_cli,
+        7: cli_interface.search_tasks_cli,
+        8: cli_interface.filter_tasks_cli,
+        9: cli_interface.sort_tasks_cli,
+        10: cli_interface.advanced_tasks_cli,
+    }
+
     while True:
         cli_interface.display_menu()
         choice = cli_interface.get_user_choice()
 
-        if choice == 1:
-            cli_interface.add_task_cli()
-        elif choice == 2:
-            cli_interface.view_task_list_cli()
-        elif choice == 3:
-            cli_interface.update_task_cli()
-        elif choice == 4:
-            cli_interface.delete_task_cli()
-        elif choice == 5:
-            cli_interface.mark_task_complete_cli()
-        elif choice == 6:
-            cli_interface.mark_task_incomplete_cli()
-        elif choice == 7:
-            cli_interface.search_tasks_cli()
-        elif choice == 8:
-            cli_interface.filter_tasks_cli()
-        elif choice == 9:
-            cli_interface.sort_tasks_cli()
-        elif choice == 10:
-            cli_interface.advanced_tasks_cli()
-        elif choice == 11:
+        if choice == 11:
             print("Goodbye!")
             break
+        actions[choice]()
 
 
 if __name__ == "__main__":